@@ -2,14 +2,28 @@ from __future__ import annotations
 
 import os
 import json
+import uuid
 import pytest
 import allure
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+
+from pages.base_page import BasePage
+from utils.aut_server import SyntheticAutServer
+from utils.benchmark import BenchmarkSuite, merge_worker_files
+from utils.browser_pool import BrowserPool
+from utils.browser_profiles import ProfileTemplates, default_tmpfs_dir
+from utils.driver_cache import DriverResolutionCache
+from utils.driver_services import DriverServices
+from utils.har import HarServer
+from utils.locator_memo import LocatorMemo
 from utils.logger import Logger
+from utils.network_blocker import NetworkBlocker
+from utils.page_metrics import BUDGET_MODES, PageLoadMetrics, parse_budgets
 
 log = Logger.get_logger("conftest")
 
@@ -51,6 +65,194 @@ def pytest_addoption(parser):
         default="10",
         help="Default explicit wait timeout (seconds)",
     )
+    parser.addoption(
+        "--reuse-browser",
+        action="store_true",
+        default=False,
+        help="Reuse browser sessions between tests (pool per session / xdist worker)",
+    )
+    parser.addoption(
+        "--pool-size",
+        action="store",
+        default="1",
+        help="Max idle sessions kept per browser in --reuse-browser mode",
+    )
+    parser.addoption(
+        "--prewarm",
+        action="store",
+        default="0",
+        help="Number of sessions per browser started in background ahead of tests (enables --reuse-browser)",
+    )
+    parser.addoption(
+        "--reuse-page",
+        action="store_true",
+        default=False,
+        help="Skip navigation when the session is already on the target page and reset page state in place; "
+             "groups tests by page within a worker",
+    )
+    parser.addoption(
+        "--shared-service",
+        action="store_true",
+        default=False,
+        help="Start chromedriver/geckodriver once per session (xdist worker) and open only new sessions on it",
+    )
+    parser.addoption(
+        "--driver-cache",
+        action="store",
+        default="",
+        help="Path to JSON cache of resolved driver/browser binaries (skips Selenium Manager discovery)",
+    )
+    parser.addoption(
+        "--locator-memo",
+        action="store",
+        default="",
+        help="Path to JSON memo of the locator candidate that matched last time (shared by runs and xdist workers)",
+    )
+    parser.addoption(
+        "--profile-template",
+        action="store_true",
+        default=False,
+        help="Build one pre-initialized browser profile per run and give each session a copy of it",
+    )
+    parser.addoption(
+        "--profile-tmpfs",
+        action="store",
+        default="",
+        help="RAM-backed directory for profile template and copies (default: /dev/shm or system temp)",
+    )
+    parser.addoption(
+        "--launch-profile",
+        action="store",
+        default="default",
+        choices=["default", "fast", "minimal"],
+        help="Browser launch preset: default, fast (no background services) or minimal (fast + no images/web fonts)",
+    )
+    parser.addoption(
+        "--block-list",
+        action="store",
+        default="",
+        help="File with URL glob patterns (one per line) blocked in every browser session",
+    )
+    parser.addoption(
+        "--record-har",
+        action="store",
+        default="",
+        help="Record AUT traffic through a local proxy into per-page HAR archives in this directory",
+    )
+    parser.addoption(
+        "--replay-har",
+        action="store",
+        default="",
+        help="Serve AUT from HAR archives in this directory via a local server (no network)",
+    )
+    parser.addoption(
+        "--har-timing",
+        action="store_true",
+        default=False,
+        help="In --replay-har mode, delay each response by its recorded time",
+    )
+    parser.addoption(
+        "--aut-server",
+        action="store_true",
+        default=False,
+        help="Run tests against the built-in synthetic AUT server instead of --base-url",
+    )
+    parser.addoption(
+        "--aut-render-delay",
+        action="store",
+        default="0",
+        help="Synthetic AUT: delay (ms) before #demo/#confirmResult/#promptResult are updated",
+    )
+    parser.addoption(
+        "--aut-network-delay",
+        action="store",
+        default="0",
+        help="Synthetic AUT: delay (ms) of every HTTP response",
+    )
+    parser.addoption(
+        "--aut-alert-delay",
+        action="store",
+        default="0",
+        help="Synthetic AUT: delay (ms) before alert/confirm/prompt appear",
+    )
+    parser.addoption(
+        "--aut-drop-alerts",
+        action="store_true",
+        default=False,
+        help="Synthetic AUT: never show alert/confirm/prompt",
+    )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Run tests marked @benchmark (skipped otherwise)",
+    )
+    parser.addoption(
+        "--benchmark-warmup",
+        action="store",
+        default="3",
+        help="Benchmark: warmup iterations per interaction (not recorded)",
+    )
+    parser.addoption(
+        "--benchmark-iterations",
+        action="store",
+        default="20",
+        help="Benchmark: measured iterations per interaction",
+    )
+    parser.addoption(
+        "--benchmark-dir",
+        action="store",
+        default="benchmark-results",
+        help="Benchmark: directory for per-browser JSON results",
+    )
+    parser.addoption(
+        "--benchmark-baseline",
+        action="store",
+        default="",
+        help="Benchmark: directory with baseline per-browser JSON to compare against",
+    )
+    parser.addoption(
+        "--benchmark-alpha",
+        action="store",
+        default="0.01",
+        help="Benchmark: significance level of the one-sided Mann-Whitney test",
+    )
+    parser.addoption(
+        "--benchmark-min-effect",
+        action="store",
+        default="0.1",
+        help="Benchmark: minimal relative growth of the median counted as regression (0.1 = 10%%)",
+    )
+    parser.addoption(
+        "--page-metrics",
+        action="store",
+        default=None,
+        help="Collect page load metrics on every BasePage.open() and append them to this JSONL file",
+    )
+    parser.addoption(
+        "--page-budget-mode",
+        action="store",
+        default=None,
+        choices=list(BUDGET_MODES),
+        help="What to do when a page exceeds its load budget: off, warn or fail (overrides page_budget_mode ini)",
+    )
+    parser.addini(
+        "page_budgets",
+        type="linelist",
+        default=[],
+        help="Per-page load budgets: '<page|*>: metric=limit ...' (ms / bytes; CDP metrics as cdp.<Name>)",
+    )
+    parser.addini(
+        "page_budget_mode",
+        default="warn",
+        help="What to do when a page exceeds its load budget: off, warn or fail",
+    )
+    parser.addini(
+        "block_urls",
+        type="linelist",
+        default=[],
+        help="URL glob patterns blocked in every browser session (merged with --block-list)",
+    )
 
 def pytest_generate_tests(metafunc):
     if "driver" not in metafunc.fixturenames:
@@ -72,7 +274,81 @@ def pytest_generate_tests(metafunc):
 
     metafunc.parametrize("driver", params, indirect=True, ids=[f"browser={b}" for b in params])
 
-def _build_chrome(headless: bool, w: int, h: int) -> webdriver.Chrome:
+# Пресеты запуска: fast отключает фоновые сервисы браузера, minimal дополнительно
+# не грузит картинки и web-шрифты (тестам контента/валидации пиксели не нужны)
+_CHROME_FAST_ARGS = [
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-client-side-phishing-detection",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--mute-audio",
+]
+_CHROME_MINIMAL_ARGS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-remote-fonts",
+]
+_CHROME_MINIMAL_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+}
+
+_FIREFOX_FAST_PREFS = {
+    # фоновая сеть
+    "network.prefetch-next": False,
+    "network.dns.disablePrefetch": True,
+    "network.http.speculative-parallel-limit": 0,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "toolkit.telemetry.enabled": False,
+    # обновления компонентов и расширений
+    "app.update.auto": False,
+    "extensions.update.enabled": False,
+    "extensions.blocklist.enabled": False,
+    "media.gmp-manager.updateEnabled": False,
+    # синхронизация
+    "identity.fxaccounts.enabled": False,
+    # расширения
+    "extensions.autoDisableScopes": 15,
+    "extensions.enabledScopes": 5,
+    # троттлинг таймеров в фоне
+    "dom.min_background_timeout_value": 4,
+    "dom.timeout.enable_budget_timer_throttling": False,
+}
+_FIREFOX_MINIMAL_PREFS = {
+    "permissions.default.image": 2,
+    "gfx.downloadable_fonts.enabled": False,
+}
+
+def _apply_chrome_launch_profile(options: ChromeOptions, launch_profile: str) -> None:
+    if launch_profile not in ("fast", "minimal"):
+        return
+    for arg in _CHROME_FAST_ARGS:
+        options.add_argument(arg)
+    if launch_profile == "minimal":
+        for arg in _CHROME_MINIMAL_ARGS:
+            options.add_argument(arg)
+        options.add_experimental_option("prefs", dict(_CHROME_MINIMAL_PREFS))
+
+def _apply_firefox_launch_profile(options: FirefoxOptions, launch_profile: str) -> None:
+    if launch_profile not in ("fast", "minimal"):
+        return
+    prefs = dict(_FIREFOX_FAST_PREFS)
+    if launch_profile == "minimal":
+        prefs.update(_FIREFOX_MINIMAL_PREFS)
+    for name, value in prefs.items():
+        options.set_preference(name, value)
+
+def _build_chrome(headless: bool, w: int, h: int, services: DriverServices | None = None,
+                  resolver: DriverResolutionCache | None = None,
+                  profile_dir: str | None = None,
+                  launch_profile: str = "default",
+                  blocker: NetworkBlocker | None = None) -> webdriver.Chrome:
     options = ChromeOptions()
     options.page_load_strategy = "eager"
 
@@ -86,13 +362,23 @@ def _build_chrome(headless: bool, w: int, h: int) -> webdriver.Chrome:
     options.add_argument("--high-dpi-support=1")
     options.add_argument("--disable-features=Translate,AutomationControlled")
 
-    options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+    logging_prefs = {"browser": "ALL"}
+    if blocker:
+        logging_prefs = blocker.chrome_logging_prefs(logging_prefs)
+    options.set_capability("goog:loggingPrefs", logging_prefs)
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
 
     if headless:
         options.add_argument("--headless=new")
 
+    _apply_chrome_launch_profile(options, launch_profile)
+
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        options.add_argument("--no-first-run")
+        options.add_argument("--no-default-browser-check")
+
     remote_url = os.getenv("SELENIUM_REMOTE_URL")
     if remote_url:
         log.info(f"Using remote Chrome at {remote_url}")
@@ -100,14 +386,33 @@ def _build_chrome(headless: bool, w: int, h: int) -> webdriver.Chrome:
         driver.set_window_size(w, h)
         return driver
 
-    return webdriver.Chrome(options=options)
+    if services is not None:
+        return services.new_session("chrome", options)
+
+    service = ChromeService(executable_path=resolver.resolve("chrome", options)) if resolver else None
+    return webdriver.Chrome(options=options, service=service)
 
-def _build_firefox(headless: bool, w: int, h: int) -> webdriver.Firefox:
+def _build_firefox(headless: bool, w: int, h: int, services: DriverServices | None = None,
+                   resolver: DriverResolutionCache | None = None,
+                   profile_dir: str | None = None,
+                   launch_profile: str = "default",
+                   blocker: NetworkBlocker | None = None) -> webdriver.Firefox:
     options = FirefoxOptions()
     options.page_load_strategy = "eager"
     if headless:
         options.add_argument("-headless")
 
+    _apply_firefox_launch_profile(options, launch_profile)
+
+    if blocker:
+        for name, value in blocker.firefox_prefs().items():
+            options.set_preference(name, value)
+
+    if profile_dir:
+        # профиль используется на месте, без упаковки FirefoxProfile в base64
+        options.add_argument("-profile")
+        options.add_argument(profile_dir)
+
     remote_url = os.getenv("SELENIUM_REMOTE_URL")
     if remote_url:
         log.info(f"Using remote Firefox at {remote_url}")
@@ -115,15 +420,26 @@ def _build_firefox(headless: bool, w: int, h: int) -> webdriver.Firefox:
         driver.set_window_size(w, h)
         return driver
 
-    driver = webdriver.Firefox(options=options)
+    if services is not None:
+        driver = services.new_session("firefox", options)
+    else:
+        service = FirefoxService(executable_path=resolver.resolve("firefox", options)) if resolver else None
+        driver = webdriver.Firefox(options=options, service=service)
     driver.set_window_size(w, h)
     return driver
 
-def get_driver(browser_name: str, headless: bool, w: int, h: int) -> webdriver.Remote:
+def get_driver(browser_name: str, headless: bool, w: int, h: int,
+               services: DriverServices | None = None,
+               resolver: DriverResolutionCache | None = None,
+               profile_dir: str | None = None,
+               launch_profile: str = "default",
+               blocker: NetworkBlocker | None = None) -> webdriver.Remote:
+    kwargs = dict(services=services, resolver=resolver, profile_dir=profile_dir,
+                  launch_profile=launch_profile, blocker=blocker)
     if browser_name == "chrome":
-        return _build_chrome(headless, w, h)
+        return _build_chrome(headless, w, h, **kwargs)
     if browser_name == "firefox":
-        return _build_firefox(headless, w, h)
+        return _build_firefox(headless, w, h, **kwargs)
     raise ValueError(f"Unsupported browser: {browser_name}")
 
 def pytest_generate_tests(metafunc):
@@ -132,14 +448,148 @@ def pytest_generate_tests(metafunc):
         params = ["chrome", "firefox"] if browser == "both" else [browser]
         metafunc.parametrize("driver", params, indirect=True, ids=params)
 
+def pytest_configure(config):
+    if config.getoption("--record-har") and config.getoption("--replay-har"):
+        raise pytest.UsageError("--record-har and --replay-har are mutually exclusive")
+    if config.getoption("--aut-server") and (config.getoption("--record-har") or config.getoption("--replay-har")):
+        raise pytest.UsageError("--aut-server cannot be combined with --record-har/--replay-har")
+    BasePage.reuse_navigation = bool(config.getoption("--reuse-page"))
+    BasePage.locator_memo = LocatorMemo(config.getoption("--locator-memo") or None)
+
+    workerinput = getattr(config, "workerinput", None)
+    config._ui_run_id = (workerinput or {}).get("ui_run_id") or uuid.uuid4().hex[:12]
+
+    budget_mode = config.getoption("--page-budget-mode") or config.getini("page_budget_mode")
+    if budget_mode not in BUDGET_MODES:
+        raise pytest.UsageError(f"page_budget_mode must be one of {', '.join(BUDGET_MODES)}, got {budget_mode!r}")
+    try:
+        budgets = parse_budgets(config.getini("page_budgets"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e)) from None
+    # сбор стоит async-скрипта на каждый open() — только когда метрики кому-то нужны
+    metrics_path = config.getoption("--page-metrics")
+    if metrics_path or budgets:
+        BasePage.page_metrics = PageLoadMetrics(
+            metrics_path or None,
+            budgets=budgets,
+            budget_mode=budget_mode,
+            run_id=config._ui_run_id,
+        )
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    # xdist: все воркеры одного прогона делят шаблонные профили
+    node.workerinput["ui_run_id"] = node.config._ui_run_id
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--benchmark"):
+        skip_benchmark = pytest.mark.skip(reason="benchmark: запускается только с --benchmark")
+        for item in items:
+            if item.get_closest_marker("benchmark"):
+                item.add_marker(skip_benchmark)
+
+    if not config.getoption("--reuse-page"):
+        return
+
+    # группируем по (браузер, страница): соседние тесты на одной странице не перезагружают её
+    def page_group(item) -> tuple[str, str]:
+        callspec = getattr(item, "callspec", None)
+        browser = str(callspec.params.get("driver", "")) if callspec else ""
+        return browser, item.path.parent.name
+
+    items.sort(key=page_group)
+
+def pytest_sessionfinish(session, exitstatus):
+    # xdist: воркеры пишут <browser>.<worker>.json, контроллер сливает их в один файл на браузер
+    config = session.config
+    if getattr(config, "workerinput", None) is None and config.getoption("--benchmark"):
+        bench_dir = config.getoption("--benchmark-dir")
+        if os.path.isdir(bench_dir):
+            for path in merge_worker_files(bench_dir):
+                log.info(f"Benchmark: merged worker results into {path}")
+
+def pytest_unconfigure(config):
+    if getattr(config, "workerinput", None) is None and config.getoption("--profile-template"):
+        root = config.getoption("--profile-tmpfs") or default_tmpfs_dir()
+        ProfileTemplates.cleanup_run(root, config._ui_run_id)
+
+@pytest.fixture(scope="session")
+def _har_server(request):
+    record_dir = request.config.getoption("--record-har")
+    replay_dir = request.config.getoption("--replay-har")
+    if not (record_dir or replay_dir):
+        yield None
+        return
+    if record_dir:
+        server = HarServer("record", record_dir, upstream=request.config.getoption("--base-url"))
+    else:
+        server = HarServer("replay", replay_dir, replay_timing=request.config.getoption("--har-timing"))
+    server.start()
+    yield server
+    server.stop()
+    server.save()
+    if server.misses:
+        log.warning(f"HAR replay: {server.misses} request(s) were not found in archives")
+
+@pytest.fixture(scope="session")
+def aut_server(request) -> SyntheticAutServer | None:
+    """Синтетический AUT (``--aut-server``); тест может менять задержки через ``aut_server.configure()``."""
+    if not request.config.getoption("--aut-server"):
+        yield None
+        return
+    server = SyntheticAutServer(
+        render_delay_ms=int(request.config.getoption("--aut-render-delay")),
+        network_delay_ms=int(request.config.getoption("--aut-network-delay")),
+        alert_delay_ms=int(request.config.getoption("--aut-alert-delay")),
+        drop_alerts=request.config.getoption("--aut-drop-alerts"),
+    )
+    server.start()
+    yield server
+    server.stop()
+
 @pytest.fixture(scope="session")
-def base_url(request) -> str:
+def base_url(request, _har_server, aut_server) -> str:
+    if aut_server is not None:
+        return aut_server.base_url
+    if _har_server is not None:
+        return _har_server.base_url
     return request.config.getoption("--base-url").rstrip("/")
 
 @pytest.fixture(scope="session")
 def wait_timeout(request) -> int:
     return int(request.config.getoption("--wait-timeout"))
 
+@pytest.fixture(scope="session")
+def _benchmark_suite(request) -> BenchmarkSuite:
+    suite = BenchmarkSuite(
+        request.config.getoption("--benchmark-dir"),
+        baseline_dir=request.config.getoption("--benchmark-baseline") or None,
+        warmup=int(request.config.getoption("--benchmark-warmup")),
+        iterations=int(request.config.getoption("--benchmark-iterations")),
+        alpha=float(request.config.getoption("--benchmark-alpha")),
+        min_effect=float(request.config.getoption("--benchmark-min-effect")),
+    )
+    yield suite
+    suite.save()
+
+@pytest.fixture
+def benchmark(request, _benchmark_suite):
+    """``benchmark(name, measure)``: прогон замера (мс) с прогревом; результат — ``BenchmarkResult``."""
+    callspec = getattr(request.node, "callspec", None)
+    browser = str(callspec.params.get("driver", "")) if callspec else ""
+
+    def run(name: str, measure):
+        result = _benchmark_suite.run(browser, name, measure)
+        allure.attach(
+            json.dumps({"stats": result.stats, "samples": result.samples,
+                        "comparison": result.comparison._asdict() if result.comparison else None},
+                       indent=2, ensure_ascii=False),
+            f"benchmark_{name}", allure.attachment_type.JSON,
+        )
+        return result
+
+    return run
+
 @pytest.fixture(scope="session", autouse=True)
 def _allure_env(request, base_url):
     try:
@@ -150,6 +600,7 @@ def _allure_env(request, base_url):
             "headless": str(bool(request.config.getoption("--headless") or os.getenv("CI"))),
             "window": f"{request.config.getoption('--window-width')}x{request.config.getoption('--window-height')}",
             "remote": os.getenv("SELENIUM_REMOTE_URL") or "",
+            "launch_profile": request.config.getoption("--launch-profile"),
         }
         with open(os.path.join("allure-results", "environment.properties"), "w", encoding="utf-8") as f:
             for k, v in env.items():
@@ -158,12 +609,125 @@ def _allure_env(request, base_url):
         pass
 
 
-@pytest.fixture
-def driver(request) -> webdriver.Remote:
-    browser_name = request.param
+def _quit_driver(drv: webdriver.Remote) -> None:
+    try:
+        drv.quit()
+    except Exception as e:
+        log.exception(f"Error on driver.quit(): {e}")
+
+@pytest.fixture(scope="session")
+def _driver_resolver(request) -> DriverResolutionCache | None:
+    path = request.config.getoption("--driver-cache")
+    if not path or os.getenv("SELENIUM_REMOTE_URL"):
+        return None
+    return DriverResolutionCache(path)
+
+@pytest.fixture(scope="session")
+def _driver_services(request, _driver_resolver):
+    if not request.config.getoption("--shared-service") or os.getenv("SELENIUM_REMOTE_URL"):
+        yield None
+        return
+    services = DriverServices(resolver=_driver_resolver)
+    yield services
+    services.stop_all()
+
+@pytest.fixture(scope="session")
+def _network_blocker(request) -> NetworkBlocker | None:
+    blocker = NetworkBlocker.from_sources(
+        request.config.getoption("--block-list"),
+        request.config.getini("block_urls"),
+    )
+    if not blocker:
+        return None
+    log.info(f"URL block list: {len(blocker.patterns)} pattern(s)")
+    return blocker
+
+@pytest.fixture(scope="session")
+def _profile_templates(request, _driver_services, _driver_resolver):
+    if not request.config.getoption("--profile-template") or os.getenv("SELENIUM_REMOTE_URL"):
+        return None
     headless = bool(request.config.getoption("--headless") or os.getenv("CI"))
     w = int(request.config.getoption("--window-width"))
     h = int(request.config.getoption("--window-height"))
+    launch_profile = request.config.getoption("--launch-profile")
+
+    def launcher(browser_name: str, profile_dir: str) -> webdriver.Remote:
+        return get_driver(browser_name, headless, w, h, services=_driver_services,
+                          resolver=_driver_resolver, profile_dir=profile_dir,
+                          launch_profile=launch_profile)
+
+    root = request.config.getoption("--profile-tmpfs") or default_tmpfs_dir()
+    return ProfileTemplates(root, request.config._ui_run_id, launcher)
+
+@pytest.fixture(scope="session")
+def _driver_factory(request, _driver_services, _driver_resolver, _profile_templates, _network_blocker):
+    headless = bool(request.config.getoption("--headless") or os.getenv("CI"))
+    w = int(request.config.getoption("--window-width"))
+    h = int(request.config.getoption("--window-height"))
+    launch_profile = request.config.getoption("--launch-profile")
+
+    def factory(browser_name: str) -> webdriver.Remote:
+        log.info(f"Initializing {browser_name} (headless={headless}, launch_profile={launch_profile}) {w}x{h}")
+        profile_dir = _profile_templates.clone(browser_name) if _profile_templates else None
+        drv = get_driver(browser_name, headless, w, h, services=_driver_services,
+                         resolver=_driver_resolver, profile_dir=profile_dir,
+                         launch_profile=launch_profile, blocker=_network_blocker)
+        if profile_dir:
+            _profile_templates.register(drv, profile_dir)
+        if _network_blocker:
+            _network_blocker.apply(drv, browser_name)
+        drv.set_page_load_timeout(60)
+        drv.set_script_timeout(30)
+        drv.implicitly_wait(0)
+        return drv
+
+    return factory
+
+@pytest.fixture(scope="session")
+def _driver_closer(_profile_templates):
+    def closer(drv: webdriver.Remote) -> None:
+        _quit_driver(drv)
+        if _profile_templates is not None:
+            _profile_templates.release(drv)
+
+    return closer
+
+@pytest.fixture(scope="session")
+def _browser_pool(request, _driver_factory, _driver_closer):
+    prewarm = int(request.config.getoption("--prewarm"))
+    if not (request.config.getoption("--reuse-browser") or prewarm > 0):
+        yield None
+        return
+    pool = BrowserPool(
+        _driver_factory,
+        _driver_closer,
+        size=int(request.config.getoption("--pool-size")),
+        prewarm=prewarm,
+        keep_page=request.config.getoption("--reuse-page"),
+    )
+    browser_opt = request.config.getoption("--browser")
+    pool.warm_up(["chrome", "firefox"] if browser_opt == "both" else [browser_opt])
+    yield pool
+    pool.close_all()
+
+
+def _report_blocked_requests(blocker: NetworkBlocker | None, drv: webdriver.Remote, browser_name: str, nodeid: str) -> None:
+    if not blocker:
+        return
+    try:
+        blocked = blocker.blocked_requests(drv, browser_name)
+    except Exception as e:
+        log.debug(f"Cannot collect blocked requests: {e}")
+        return
+    log.info(f"{nodeid}: blocked {len(blocked)} request(s)")
+    try:
+        allure.attach("\n".join(blocked) or "-", f"blocked_requests ({len(blocked)})", allure.attachment_type.TEXT)
+    except Exception:
+        pass
+
+@pytest.fixture
+def driver(request, _driver_factory, _driver_closer, _browser_pool, _network_blocker) -> webdriver.Remote:
+    browser_name = request.param
     node = request.node
     chrome_only = node.get_closest_marker("chrome_only") is not None
     firefox_only = node.get_closest_marker("firefox_only") is not None
@@ -172,20 +736,23 @@ def driver(request) -> webdriver.Remote:
     if firefox_only and browser_name != "firefox":
         pytest.skip("firefox_only: пропускаем запуск не в Firefox")
 
-    log.info(f"Initializing {browser_name} (headless={headless}) {w}x{h}")
-    drv = get_driver(browser_name, headless, w, h)
+    if _browser_pool is not None:
+        drv = _browser_pool.acquire(browser_name)
+        if _network_blocker:
+            _network_blocker.reset_counter(drv, browser_name)
+        yield drv
+        _report_blocked_requests(_network_blocker, drv, browser_name, node.nodeid)
+        _browser_pool.release(browser_name, drv)
+        return
 
-    drv.set_page_load_timeout(60)
-    drv.set_script_timeout(30)
-    drv.implicitly_wait(0)
+    drv = _driver_factory(browser_name)
 
     yield drv
 
+    _report_blocked_requests(_network_blocker, drv, browser_name, node.nodeid)
+
     log.info(f"Closing {browser_name}")
-    try:
-        drv.quit()
-    except Exception as e:
-        log.exception(f"Error on driver.quit(): {e}")
+    _driver_closer(drv)
 
 def _attach_artifacts_if_possible(driver: webdriver.Remote) -> None:
     # Скриншот
@@ -1,38 +1,527 @@
 from __future__ import annotations
 
-from typing import Tuple, Any
+import json
+import time
+from typing import Tuple, Any, Callable, Dict, Iterable, Mapping, NamedTuple, Sequence
 import allure
 
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
+    JavascriptException,
     ElementClickInterceptedException,
+    NoSuchElementException,
     StaleElementReferenceException,
 )
 
+from utils.cdp import cdp, supports_cdp
+from utils.locator_memo import LocatorMemo
 from utils.logger import Logger
+from utils.page_metrics import PageLoadMetrics
 
 Locator = Tuple[By, str]
 
+# Поиск элементов по Selenium-локатору внутри страницы, проверка видимости и
+# компиляция предикатов wait_js (одна компиляция на документ для каждого исходника).
+# isShown — приближение WebElement.is_displayed(): есть layout-боксы и элемент не скрыт стилями
+_JS_FIND = r"""
+    function compile(src) {
+        const cache = window.__poPredicates || (window.__poPredicates = new Map());
+        if (!cache.has(src)) {
+            cache.set(src, new Function('find', 'findAll', 'isShown', 'compile', 'return (' + src + ');')(
+                find, findAll, isShown, compile));
+        }
+        return cache.get(src);
+    }
+    function isShown(el) {
+        const st = getComputedStyle(el);
+        return el.getClientRects().length > 0
+            && st.visibility !== 'hidden' && st.display !== 'none' && st.opacity !== '0';
+    }
+    function findAll(by, value) {
+        switch (by) {
+            case 'id': return Array.from(document.querySelectorAll(`#${CSS.escape(value)}`));
+            case 'name': return Array.from(document.querySelectorAll(`[name="${CSS.escape(value)}"]`));
+            case 'class name': return Array.from(document.getElementsByClassName(value));
+            case 'tag name': return Array.from(document.getElementsByTagName(value));
+            case 'xpath': {
+                const res = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                const out = [];
+                for (let i = 0; i < res.snapshotLength; i++) out.push(res.snapshotItem(i));
+                return out;
+            }
+            default: return Array.from(document.querySelectorAll(value));
+        }
+    }
+    function find(by, value) {
+        switch (by) {
+            case 'css selector': return document.querySelector(value);
+            case 'id': return document.getElementById(value);
+            case 'name': return document.querySelector(`[name="${CSS.escape(value)}"]`);
+            case 'class name': return document.getElementsByClassName(value)[0] || null;
+            case 'tag name': return document.getElementsByTagName(value)[0] || null;
+            case 'xpath':
+                return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            default: return document.querySelector(value);
+        }
+    }
+"""
+
+# Событийное ожидание: предикат проверяется сразу, на каждую мутацию DOM и раз в
+# 50 мс — изменения только стилей/свойств (:hover, transition, opacity, input.value)
+# мутаций не дают. Ответ приходит в момент выполнения условия — один round trip
+_JS_OBSERVE_UNTIL = _JS_FIND + r"""
+    const done = arguments[arguments.length - 1];
+    const pred = compile(arguments[0]);
+    const args = arguments[1] || [];
+    const timeoutMs = arguments[2];
+    const check = () => { try { return pred.apply(null, args); } catch (e) { return null; } };
+
+    const first = check();
+    if (first) { done({ok: true, value: first}); return; }
+
+    let finished = false, timer = null, ticker = null;
+    const recheck = () => {
+        if (finished) return;
+        const v = check();
+        if (v) finish({ok: true, value: v});
+    };
+    const obs = new MutationObserver(recheck);
+    function finish(res) {
+        finished = true;
+        obs.disconnect();
+        clearTimeout(timer);
+        clearInterval(ticker);
+        done(res);
+    }
+    obs.observe(document.documentElement || document,
+                {subtree: true, childList: true, characterData: true, attributes: true});
+    ticker = setInterval(recheck, 50);
+    timer = setTimeout(() => finish({ok: false}), timeoutMs);
+"""
+
+# Снимок нескольких элементов за один execute_script
+_JS_SNAPSHOT = _JS_FIND + r"""
+    const spec = arguments[0], props = arguments[1], attrs = arguments[2];
+    const out = {};
+    for (const [name, loc] of Object.entries(spec)) {
+        const el = find(loc[0], loc[1]);
+        if (!el) { out[name] = null; continue; }
+        const displayed = isShown(el);
+        const r = {element: el, attrs: {}};
+        if (props.includes('text')) r.text = displayed ? (el.innerText || '').trim() : '';
+        if (props.includes('displayed')) r.displayed = displayed;
+        if (props.includes('enabled')) r.enabled = !el.disabled;
+        if (props.includes('rect')) {
+            const b = el.getBoundingClientRect();
+            r.rect = {x: b.left + window.scrollX, y: b.top + window.scrollY, width: b.width, height: b.height};
+        }
+        for (const a of attrs) r.attrs[a] = el.getAttribute(a);
+        out[name] = r;
+    }
+    return out;
+"""
+
+_JS_CHECK_ONCE = _JS_FIND + r"""
+    const pred = compile(arguments[0]);
+    try { return pred.apply(null, arguments[1] || []) || null; } catch (e) { return null; }
+"""
+# Вызов зарегистрированного скрипта по короткому handle; по сети идёт только эта строка
+_JS_CALL = r"""
+    const f = window.__po && window.__po[arguments[0]];
+    if (!f) return {__po_missing__: true};
+    return f.apply(null, Array.prototype.slice.call(arguments, 1));
+"""
+
+_JS_CALL_ASYNC = r"""
+    const f = window.__po && window.__po[arguments[0]];
+    if (!f) { arguments[arguments.length - 1]({__po_missing__: true}); return; }
+    f.apply(null, Array.prototype.slice.call(arguments, 1));
+"""
+
+# Скомпилированные реестры по классам страниц: name -> handle и install-скрипт
+_REGISTRIES: Dict[type, Tuple[Dict[str, str], str]] = {}
+
+
+# Для каждого логического элемента — первый совпавший кандидат (по порядку);
+# с needText — только с непустым текстом, с partial — вернуть и неполный результат
+_JS_FIRST_MATCH = (
+    "(specs, needText, partial) => { const out = {}; let all = true;"
+    " for (const [name, cands] of Object.entries(specs)) {"
+    "  let hit = null;"
+    "  for (let i = 0; i < cands.length && !hit; i++) {"
+    "   const el = find(cands[i][0], cands[i][1]); if (!el) continue;"
+    "   const t = (el.innerText || '').trim(); if (needText && !t) continue;"
+    "   hit = {index: i, element: el, text: t}; }"
+    "  if (hit) out[name] = hit; else all = false; }"
+    " return (all || partial) ? out : null; }"
+)
+
+
+# Синтетическая отправка шагов одним async-скриптом. Недоверенные события не
+# запускают действий браузера по умолчанию, поэтому они эмулируются: Enter/Space
+# активируют кнопки, Enter в поле ввода отправляет форму, символы дописываются в value
+_JS_DISPATCH = _JS_FIND + r"""
+    const done = arguments[arguments.length - 1];
+    const steps = arguments[0];
+    const fire = (el, type, Ctor, init) => el.dispatchEvent(new Ctor(type, Object.assign(
+        {bubbles: true, cancelable: true, composed: true, view: window}, init || {})));
+    const center = el => {
+        const r = el.getBoundingClientRect();
+        return {clientX: r.left + r.width / 2, clientY: r.top + r.height / 2, button: 0};
+    };
+    const hover = el => {
+        const c = center(el);
+        fire(el, 'pointerover', PointerEvent, c); fire(el, 'mouseover', MouseEvent, c);
+        fire(el, 'pointermove', PointerEvent, c); fire(el, 'mousemove', MouseEvent, c);
+    };
+    const click = el => {
+        hover(el);
+        const c = center(el);
+        fire(el, 'pointerdown', PointerEvent, c); fire(el, 'mousedown', MouseEvent, c);
+        if (el.focus) el.focus();
+        fire(el, 'pointerup', PointerEvent, c); fire(el, 'mouseup', MouseEvent, c);
+        el.click();
+    };
+    const isButton = el => el.matches('button, input[type=button], input[type=submit], input[type=reset], a[href]');
+    const isToggle = el => el.matches('input[type=checkbox], input[type=radio]');
+    const isText = el => el.matches('textarea, input:not([type]), input[type=text], input[type=email], '
+        + 'input[type=password], input[type=search], input[type=tel], input[type=url], input[type=number]');
+    const press = (el, key) => {
+        const printable = key.length === 1;
+        if (!fire(el, 'keydown', KeyboardEvent, {key})) { fire(el, 'keyup', KeyboardEvent, {key}); return; }
+        if (printable) fire(el, 'keypress', KeyboardEvent, {key});
+        if (key === 'Enter' && isButton(el)) el.click();
+        else if (key === 'Enter' && el.matches('input') && el.form) el.form.requestSubmit();
+        else if (isText(el) && (printable || key === 'Enter' || key === 'Backspace')) {
+            if (key === 'Backspace') el.value = el.value.slice(0, -1);
+            else el.value += (key === 'Enter' ? '\n' : key);
+            fire(el, 'input', InputEvent, {data: printable ? key : null});
+        }
+        fire(el, 'keyup', KeyboardEvent, {key});
+        if (key === ' ' && (isButton(el) || isToggle(el))) el.click();
+    };
+
+    (async () => {
+        let n = 0;
+        for (const s of steps) {
+            const el = s.by ? find(s.by, s.value) : document.activeElement;
+            if (s.by && !el) throw new Error(`No element for ${s.by}=${s.value}`);
+            if (el && el.scrollIntoView && s.kind !== 'pause') el.scrollIntoView({block: 'center'});
+            if (s.kind === 'click') click(el);
+            else if (s.kind === 'move') hover(el);
+            else if (s.kind === 'press') { if (s.by && el.focus) el.focus(); for (const k of s.keys) press(el, k); }
+            else if (s.kind === 'type') {
+                click(el);
+                for (const k of s.keys) press(el, k);
+                fire(el, 'change', Event);
+            }
+            else if (s.kind === 'pause') await new Promise(r => setTimeout(r, s.ms));
+            n++;
+        }
+        return n;
+    })().then(n => done({ok: true, steps: n}), e => done({ok: false, error: String(e)}));
+"""
+
+# Зонд задержки: отметки performance.now() ставятся в самой странице. Старт —
+# timeStamp клика (доверенный клик вытесняет синтетический), финиш — первая мутация
+# любого из целевых элементов или вызов alert/confirm/prompt (обёртки снимаются в latency_read).
+_JS_LATENCY_ARM = _JS_FIND + r"""
+    const targets = arguments[0], watchDialogs = arguments[1];
+    if (window.__poLatency && window.__poLatency.stop) window.__poLatency.stop();
+    const probe = window.__poLatency = {
+        armed: performance.now(), click: null, trusted: false,
+        mutation: null, target: null, dialog: null, dialogKind: null,
+    };
+    const onClick = (e) => {
+        if (probe.click !== null && (probe.trusted || !e.isTrusted)) return;
+        probe.click = e.timeStamp || performance.now();
+        probe.trusted = e.isTrusted;
+    };
+    document.addEventListener('click', onClick, true);
+    const observers = [];
+    targets.forEach((t, i) => {
+        const el = find(t[0], t[1]);
+        if (!el) return;
+        const mo = new MutationObserver(() => {
+            if (probe.mutation !== null) return;
+            probe.mutation = performance.now();
+            probe.target = i;
+        });
+        mo.observe(el, {childList: true, characterData: true, subtree: true, attributes: true});
+        observers.push(mo);
+    });
+    const originals = {};
+    if (watchDialogs) {
+        for (const kind of ['alert', 'confirm', 'prompt']) {
+            const orig = originals[kind] = window[kind];
+            window[kind] = function () {
+                if (probe.dialog === null) { probe.dialog = performance.now(); probe.dialogKind = kind; }
+                return orig.apply(window, arguments);
+            };
+        }
+    }
+    probe.stop = () => {
+        document.removeEventListener('click', onClick, true);
+        observers.forEach(mo => mo.disconnect());
+        for (const kind of Object.keys(originals)) window[kind] = originals[kind];
+    };
+    return observers.length === targets.length;
+"""
+
+# Клавиши Selenium (Keys.*) -> KeyboardEvent.key для синтетической отправки
+_KEY_NAMES: Dict[str, str] = {
+    Keys.ENTER: "Enter", Keys.RETURN: "Enter", Keys.SPACE: " ", Keys.TAB: "Tab",
+    Keys.BACKSPACE: "Backspace", Keys.ESCAPE: "Escape", Keys.DELETE: "Delete",
+    Keys.ARROW_UP: "ArrowUp", Keys.ARROW_DOWN: "ArrowDown",
+    Keys.ARROW_LEFT: "ArrowLeft", Keys.ARROW_RIGHT: "ArrowRight",
+    Keys.HOME: "Home", Keys.END: "End",
+}
+
+
+class Step(NamedTuple):
+    """Шаг пакетного взаимодействия для ``BasePage.perform``."""
+
+    kind: str
+    locator: Locator | None = None
+    value: Any = None
+
+    @classmethod
+    def click(cls, locator: Locator) -> "Step":
+        return cls("click", locator)
+
+    @classmethod
+    def move(cls, locator: Locator) -> "Step":
+        return cls("move", locator)
+
+    @classmethod
+    def type(cls, locator: Locator, text: str) -> "Step":
+        """Клик в поле и ввод текста."""
+        return cls("type", locator, text)
+
+    @classmethod
+    def press(cls, keys: str, locator: Locator | None = None) -> "Step":
+        """Нажать клавиши на элементе (или на текущем фокусе, если локатор не задан)."""
+        return cls("press", locator, keys)
+
+    @classmethod
+    def pause(cls, seconds: float) -> "Step":
+        return cls("pause", None, seconds)
+
+
+class LastResort(tuple):
+    """Кандидат-«ловушка» (``body``, любой ``h1``) для ``resolve``.
+
+    Совпадает почти всегда, поэтому проверяется последним и в ``locator_memo``
+    не попадает — иначе он навсегда вытеснил бы предпочтительные кандидаты.
+    """
+
+
+class Resolved(NamedTuple):
+    locator: Locator
+    element: WebElement
+    text: str
+
+
+class Latency(NamedTuple):
+    """Результат ``BasePage.measure_latency``.
+
+    ``in_page_ms`` — от клика до реакции по часам страницы (None, если реакции
+    не видно из страницы); ``end_to_end_ms`` — то же со стороны теста, вместе
+    с HTTP-вызовами WebDriver и опросом. ``trusted`` — клик был доверенным.
+    """
+
+    in_page_ms: float | None
+    end_to_end_ms: float
+    trusted: bool
+    outcome: str
+
+
+def _is_missing(result: Any) -> bool:
+    return isinstance(result, dict) and bool(result.get("__po_missing__"))
+
+
 class BasePage:
+    # Переиспользовать уже открытую страницу вместо driver.get() (включается --reuse-page)
+    reuse_navigation: bool = False
+    # Какой из кандидатов-локаторов сработал в прошлый раз (--locator-memo пишет его на диск)
+    locator_memo: LocatorMemo = LocatorMemo()
+    # Метрики загрузки после каждой навигации в open() (ставится в pytest_configure)
+    page_metrics: PageLoadMetrics | None = None
+
+    # Реестр JS-хелперов: имя -> тело функции (аргументы через ``arguments``).
+    # Подклассы объявляют свой SCRIPTS, реестры сливаются по MRO.
+    SCRIPTS: Dict[str, str] = {
+        "observe_until": _JS_OBSERVE_UNTIL,
+        "check_once": _JS_CHECK_ONCE,
+        "snapshot": _JS_SNAPSHOT,
+        "any_shown": _JS_FIND + "return arguments[0].some(isShown);",
+        "dispatch": _JS_DISPATCH,
+        # элементы для W3C Actions одним запросом; focusFirst — сразу сфокусировать первый
+        "action_targets": _JS_FIND + r"""
+            const els = arguments[0].map(l => find(l[0], l[1]));
+            if (arguments[1] >= 0 && els[arguments[1]]) els[arguments[1]].focus();
+            return els;
+        """,
+        "latency_arm": _JS_LATENCY_ARM,
+        "latency_read": r"""
+            const p = window.__poLatency;
+            if (!p) return null;
+            p.stop();
+            window.__poLatency = null;
+            return {armed: p.armed, click: p.click, trusted: p.trusted, mutation: p.mutation,
+                    target: p.target, dialog: p.dialog, dialogKind: p.dialogKind};
+        """,
+        "focus": "arguments[0].focus(); return true;",
+        # фокус с кареткой в конце поля (для вставки текста через CDP)
+        "focus_end": r"""
+            const el = arguments[0];
+            el.focus();
+            try { el.setSelectionRange(el.value.length, el.value.length); } catch (e) { /* email/number */ }
+            return true;
+        """,
+        # ввод через value: нативный setter (его видят и фреймворки) + input/change
+        "set_value": r"""
+            const el = arguments[0], text = arguments[1], clear = arguments[2];
+            const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            const setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+            el.focus();
+            setter.call(el, (clear ? '' : el.value) + text);
+            el.dispatchEvent(new InputEvent('input', {bubbles: true, inputType: 'insertText', data: text}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+            return el.value;
+        """,
+    }
+
     def __init__(self, driver: WebDriver, wait_timeout: int = 10):
         self.driver = driver
         self.wait = WebDriverWait(driver, wait_timeout, poll_frequency=0.2)
         self.log = Logger.get_logger(self.__class__.__name__)
+        # Кеш найденных элементов по локатору: живёт до stale или навигации через open()
+        self._elements: Dict[Locator, WebElement] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._resolved: Dict[str, Locator] = {}
 
-    def open(self, url: str) -> None:
+    def open(self, url: str, reuse: bool | None = None) -> None:
+        reuse = self.reuse_navigation if reuse is None else reuse
+        if reuse and self._is_current_url(url) and self.reset_state():
+            self.log.info(f"Reusing already opened URL: {url} (state reset in place)")
+            return
         self.log.info(f"Opening URL: {url}")
+        self.forget()
+        timed_out = False
         try:
             self.driver.get(url)
         except TimeoutException:
             self.log.warning(f"Page load timed out for {url}; continue with explicit waits")
+            timed_out = True
+        if self.page_metrics is not None:
+            self.page_metrics.after_open(self.driver, url, timed_out=timed_out, timeout=self.wait._timeout)
+
+    def reset_state(self) -> bool:
+        """Сбросить состояние уже открытой страницы без перезагрузки.
+
+        Возвращает True, если страницу можно переиспользовать; по умолчанию — нет.
+        """
+        return False
+
+    def _is_current_url(self, url: str) -> bool:
+        try:
+            cur = self.driver.current_url
+        except Exception:
+            return False
+        norm = lambda u: u.split("#", 1)[0].rstrip("/").lower()
+        return norm(cur) == norm(url)
 
     def find(self, locator: Locator):
+        """Элемент по локатору; из кеша — без проверки, что он ещё в документе.
+
+        Stale ловится лениво: чтения и действия идут через ``_on_element``,
+        который на StaleElementReferenceException находит элемент заново.
+        """
+        key = tuple(locator)
+        el = self._elements.get(key)
+        if el is not None:
+            self.cache_hits += 1
+            return el
+        self.cache_misses += 1
         self.log.debug(f"Find: {locator}")
-        return self.wait.until(EC.presence_of_element_located(locator))
+        el = self.wait.until(EC.presence_of_element_located(locator))
+        self._elements[key] = el
+        return el
+
+    def forget(self, locator: Locator | None = None) -> None:
+        """Сбросить кеш элементов: целиком или для одного локатора."""
+        if locator is None:
+            self._elements.clear()
+            self._resolved.clear()
+        else:
+            self._elements.pop(tuple(locator), None)
+
+    def resolve(self, name: str, candidates: Sequence[Locator], require_text: bool = False,
+                timeout: float | None = None) -> Resolved:
+        """Найти логический элемент ``name`` по первому совпавшему кандидату.
+
+        Все кандидаты проверяются одним скриптом (запомненный — первым), так что
+        промах основного локатора не стоит целого ``wait_timeout``. Сработавший
+        кандидат запоминается в ``locator_memo``; если не совпал ни один, запись
+        удаляется и поднимается TimeoutException.
+        """
+        return self.resolve_all({name: candidates}, require_text=require_text, timeout=timeout)[name]
+
+    def resolve_all(self, spec: Mapping[str, Sequence[Locator]], require_text: bool = False,
+                    timeout: float | None = None) -> Dict[str, Resolved]:
+        """``resolve`` для нескольких логических элементов сразу: ждём, пока найдутся все."""
+        page = self.__class__.__name__
+        ordered = {
+            name: self.locator_memo.order(page, name, [c for c in cands if not isinstance(c, LastResort)])
+            + [c for c in cands if isinstance(c, LastResort)]
+            for name, cands in spec.items()
+        }
+        payload = {name: [[loc[0], loc[1]] for loc in cands] for name, cands in ordered.items()}
+        try:
+            found = self.wait_js(_JS_FIRST_MATCH, payload, require_text, False, timeout=timeout)
+        except TimeoutException:
+            partial = self.call("check_once", _JS_FIRST_MATCH, [payload, require_text, True]) or {}
+            for name in spec:
+                if name not in partial:
+                    self.locator_memo.forget(page, name)
+            raise
+
+        out: Dict[str, Resolved] = {}
+        for name, hit in found.items():
+            matched = ordered[name][hit["index"]]
+            locator = tuple(matched)
+            if isinstance(matched, LastResort):
+                self.locator_memo.forget(page, name)
+            else:
+                self.locator_memo.remember(page, name, locator)
+            self._elements[locator] = hit["element"]
+            self._resolved[name] = locator
+            out[name] = Resolved(locator, hit["element"], hit.get("text") or "")
+        return out
+
+    def resolve_locator(self, name: str, candidates: Sequence[Locator]) -> Locator:
+        """Локатор логического элемента; в пределах страницы резолвится один раз."""
+        if name in self._resolved:
+            return self._resolved[name]
+        return self.resolve(name, candidates).locator
+
+    def _on_element(self, locator: Locator, action: Callable[[WebElement], Any]) -> Any:
+        """Выполнить действие над элементом из кеша; на stale — найти заново и повторить один раз."""
+        try:
+            return action(self.find(locator))
+        except StaleElementReferenceException:
+            self.log.debug(f"Stale element, re-locating: {locator}")
+            self.forget(locator)
+            return action(self.find(locator))
 
     def finds(self, locator: Locator):
         self.log.debug(f"Find all: {locator}")
@@ -40,11 +529,30 @@ class BasePage:
 
     def wait_visible(self, locator: Locator):
         self.log.debug(f"Wait visible: {locator}")
-        return self.wait.until(EC.visibility_of_element_located(locator))
+        return self._wait_element(locator, EC.visibility_of, EC.visibility_of_element_located)
 
     def wait_clickable(self, locator: Locator):
         self.log.debug(f"Wait clickable: {locator}")
-        return self.wait.until(EC.element_to_be_clickable(locator))
+        return self._wait_element(locator, EC.element_to_be_clickable, EC.element_to_be_clickable)
+
+    def _wait_element(self, locator: Locator, on_element: Callable, on_locator: Callable) -> WebElement:
+        """Одно ожидание с общим дедлайном: по элементу из кеша, а без него (или на stale) — по локатору."""
+        key = tuple(locator)
+        deadline = time.monotonic() + self.wait._timeout
+        el = self._elements.get(key)
+        if el is not None:
+            try:
+                el = self.wait.until(on_element(el))
+                self.cache_hits += 1
+                return el
+            except StaleElementReferenceException:
+                self.log.debug(f"Cached element is stale, re-locating: {locator}")
+                self._elements.pop(key, None)
+        self.cache_misses += 1
+        remaining = max(deadline - time.monotonic(), 0)
+        el = WebDriverWait(self.driver, remaining, poll_frequency=0.2).until(on_locator(locator))
+        self._elements[key] = el
+        return el
 
     def wait_invisible(self, locator: Locator, timeout: int | None = None) -> bool:
         self.log.debug(f"Wait invisible: {locator}")
@@ -62,29 +570,60 @@ class BasePage:
             el = self.wait_clickable(locator)
             self._scroll_into_view(el)
             el.click()
-        except (ElementClickInterceptedException, StaleElementReferenceException):
+        except (ElementClickInterceptedException, StaleElementReferenceException) as e:
             self.log.debug(f"JS click fallback for: {locator}")
+            if isinstance(e, StaleElementReferenceException):
+                self.forget(locator)
             el = self.find(locator)
             self._scroll_into_view(el)
             self.driver.execute_script("arguments[0].click();", el)
 
-    def type(self, locator: Locator, text: str, clear: bool = True) -> None:
-        self.log.debug(f"Type into {locator}: '{text}'")
+    def type(self, locator: Locator, text: str, clear: bool = True, strategy: str = "keys") -> float:
+        """Ввести текст в поле и вернуть затраченное время в секундах.
+
+        ``keys`` — посимвольный send_keys (настоящий набор с клавиатуры);
+        ``insert`` — CDP ``Input.insertText``: браузер вставляет текст одной
+        операцией с нативными beforeinput/input (без CDP, например в Firefox,
+        откатывается на ``value``); ``value`` — запись value одним скриптом с
+        событиями input/change.
+        """
+        if strategy not in ("keys", "insert", "value"):
+            raise ValueError(f"Unsupported input strategy: {strategy!r}")
+        self.log.debug(f"Type into {locator} ({strategy}): '{text}'")
+        t0 = time.perf_counter()
         el = self.wait_visible(locator)
-        if clear:
-            try:
-                el.clear()
-            except Exception:
-                el.send_keys("\uE009" + "a")
-                el.send_keys("\uE003")
-        el.send_keys(text)
+        if strategy == "insert" and not supports_cdp(self.driver):
+            self.log.debug("No CDP channel in this session, 'insert' falls back to 'value'")
+            strategy = "value"
+
+        if strategy == "value":
+            self.call("set_value", el, text, clear)
+        else:
+            if clear:
+                try:
+                    el.clear()
+                except Exception:
+                    el.send_keys("\uE009" + "a")
+                    el.send_keys("\uE003")
+            if strategy == "keys":
+                el.send_keys(text)
+            else:
+                self.call("focus_end", el)
+                cdp(self.driver, "Input.insertText", {"text": text})
+
+        elapsed = time.perf_counter() - t0
+        self.log.info(f"Typed {len(text)} char(s) into {locator} via {strategy} in {elapsed * 1000:.1f} ms")
+        return elapsed
 
     def get_text(self, locator: Locator) -> str:
-        el = self.wait_visible(locator)
-        value = el.text
+        self.wait_visible(locator)
+        value = self._on_element(locator, lambda el: el.text)
         self.log.debug(f"Text from {locator}: '{value}'")
         return value
 
+    def get_attribute(self, locator: Locator, name: str) -> str | None:
+        return self._on_element(locator, lambda el: el.get_attribute(name))
+
     def is_visible(self, locator: Locator, timeout: int | None = None) -> bool:
         self.log.debug(f"Is visible? {locator}")
         try:
@@ -104,6 +643,315 @@ class BasePage:
         except TimeoutException:
             return False
 
+    def perform(self, steps: Iterable[Step], mode: str = "real") -> None:
+        """Выполнить серию кликов/наведений/нажатий одним пакетом.
+
+        ``real`` — настоящие события ввода: один W3C Actions payload (pointer,
+        key и wheel для прокрутки к элементу); элементы берутся одним скриптом.
+        В W3C Actions нет действия «фокус», поэтому ``Step.press`` с локатором
+        не в начале серии делит payload дополнительным JS ``focus()``.
+
+        ``synthetic`` — один async-скрипт, который диспатчит DOM-события в
+        странице; быстрее, но события недоверенные (``isTrusted === false``).
+        """
+        steps = list(steps)
+        if mode not in ("real", "synthetic"):
+            raise ValueError(f"Unsupported interaction mode: {mode!r}")
+        if not steps:
+            return
+        self.log.debug(f"Perform {len(steps)} step(s) ({mode})")
+        if mode == "synthetic":
+            self._perform_synthetic(steps)
+        else:
+            self._perform_real(steps)
+
+    def _perform_synthetic(self, steps: list) -> None:
+        payload = []
+        for s in steps:
+            item: Dict[str, Any] = {"kind": s.kind}
+            if s.locator is not None:
+                item["by"], item["value"] = s.locator[0], s.locator[1]
+            if s.kind in ("press", "type"):
+                item["keys"] = [_KEY_NAMES.get(ch, ch) for ch in s.value]
+            if s.kind == "pause":
+                item["ms"] = int(float(s.value) * 1000)
+            payload.append(item)
+        res = self.call_async("dispatch", payload) or {}
+        if not res.get("ok"):
+            raise NoSuchElementException(res.get("error") or "Synthetic dispatch failed")
+
+    def _perform_real(self, steps: list) -> None:
+        locators = list(dict.fromkeys(tuple(s.locator) for s in steps if s.locator is not None))
+        first = steps[0]
+        focus_first = locators.index(tuple(first.locator)) if (
+            first.kind == "press" and first.locator is not None) else -1
+        els = self.call("action_targets", [[loc[0], loc[1]] for loc in locators], focus_first) or []
+        missing = [loc for loc, el in zip(locators, els) if el is None]
+        if missing:
+            raise NoSuchElementException(f"No element for: {missing}")
+        by_loc = dict(zip(locators, els))
+
+        # payload собираем сами: ActionChains не выравнивает wheel-источник по тикам,
+        # и прокрутка к следующему элементу уехала бы раньше своего наведения
+        ticks: list = []
+
+        def tick(pointer: dict | None = None, key: dict | None = None, wheel: dict | None = None) -> None:
+            ticks.append(tuple(a or {"type": "pause", "duration": 0} for a in (pointer, key, wheel)))
+
+        def keys(text: str) -> None:
+            for ch in text:
+                tick(key={"type": "keyDown", "value": ch})
+                tick(key={"type": "keyUp", "value": ch})
+
+        for i, s in enumerate(steps):
+            el = by_loc.get(tuple(s.locator)) if s.locator is not None else None
+            if s.kind in ("click", "move", "type"):
+                tick(wheel={"type": "scroll", "x": 0, "y": 0, "deltaX": 0, "deltaY": 0, "duration": 0, "origin": el})
+                tick(pointer={"type": "pointerMove", "x": 0, "y": 0, "duration": 0, "origin": el})
+                if s.kind != "move":
+                    tick(pointer={"type": "pointerDown", "button": 0})
+                    tick(pointer={"type": "pointerUp", "button": 0})
+                if s.kind == "type":
+                    keys(s.value)
+            elif s.kind == "press":
+                if el is not None and i > 0:
+                    self._send_actions(ticks)
+                    ticks = []
+                    self.call("focus", el)
+                keys(s.value)
+            elif s.kind == "pause":
+                tick(pointer={"type": "pause", "duration": int(float(s.value) * 1000)})
+            else:
+                raise ValueError(f"Unsupported step: {s.kind!r}")
+        self._send_actions(ticks)
+
+    def _send_actions(self, ticks: list) -> None:
+        if not ticks:
+            return
+        pointer, key, wheel = (list(col) for col in zip(*ticks))
+        self.driver.execute(Command.W3C_ACTIONS, {"actions": [
+            {"type": "pointer", "id": "mouse", "parameters": {"pointerType": "mouse"}, "actions": pointer},
+            {"type": "key", "id": "key", "actions": key},
+            {"type": "wheel", "id": "wheel", "actions": wheel},
+        ]})
+
+    def is_absent_now(self, locator: Locator, hidden_ok: bool = True) -> bool:
+        """Элемента нет прямо сейчас — без ожидания.
+
+        Один ``find_elements`` (implicit wait в сессиях = 0); с ``hidden_ok``
+        найденные, но скрытые элементы тоже считаются отсутствующими.
+        """
+        els = self.driver.find_elements(*locator)
+        if not els:
+            return True
+        if not hidden_ok:
+            return False
+        return not self.call("any_shown", els)
+
+    @allure.step("Убедиться, что {locator} не появляется {duration} с")
+    def assert_stays_absent(self, locator: Locator, duration: float = 1.0, hidden_ok: bool = True) -> None:
+        """Элемент не появляется (не становится видимым) в течение ``duration`` секунд.
+
+        Окно наблюдения держит ``wait_js`` в странице, так что проверка занимает
+        ровно ``duration``, а не ``wait_timeout``. Условие пересчитывается на
+        каждую мутацию и по таймеру, поэтому появление только за счёт CSS
+        (display/visibility/opacity) тоже ловится.
+        """
+        try:
+            self.wait_js(
+                "(by, value, hiddenOk) => { const els = findAll(by, value);"
+                " return (hiddenOk ? els.some(isShown) : els.length > 0) || null; }",
+                locator[0], locator[1], hidden_ok, timeout=duration,
+            )
+        except TimeoutException:
+            return
+        raise AssertionError(f"{locator} appeared within {duration}s")
+
+    def measure_latency(self, trigger: Callable[[], Any], until: Locator | None = None,
+                        dialog: str | None = None, timeout: float | None = None) -> Latency:
+        """Измерить задержку реакции страницы на действие ``trigger``.
+
+        Реакция — первая мутация элемента ``until`` или появление нативного
+        диалога (``dialog``: ``accept``/``dismiss`` — чем его закрыть). Отметки
+        времени ставятся в странице через ``performance.now()``, поэтому
+        ``in_page_ms`` не включает сетевые вызовы WebDriver и шаг опроса.
+        Если клика не было, отсчёт идёт от момента установки зонда.
+        """
+        if (until is None) == (dialog is None):
+            raise ValueError("Pass exactly one of until= or dialog=")
+        if dialog not in (None, "accept", "dismiss"):
+            raise ValueError(f"Unsupported dialog action: {dialog!r}")
+        to = float(timeout if timeout is not None else self.wait._timeout)
+        targets = [[until[0], until[1]]] if until else []
+        if not self.call("latency_arm", targets, dialog is not None):
+            raise NoSuchElementException(f"Latency target not found: {until}")
+
+        t0 = time.perf_counter()
+        trigger()
+        try:
+            if dialog:
+                alert = WebDriverWait(self.driver, to, poll_frequency=0.02).until(EC.alert_is_present())
+                end_to_end = (time.perf_counter() - t0) * 1000
+                if dialog == "accept":
+                    alert.accept()
+                else:
+                    alert.dismiss()
+            else:
+                self.wait_js("() => !!(window.__poLatency && window.__poLatency.mutation !== null)", timeout=to)
+                end_to_end = (time.perf_counter() - t0) * 1000
+        except TimeoutException:
+            self.call("latency_read")
+            raise
+
+        raw = self.call("latency_read") or {}
+        done = raw.get("dialog") if dialog else raw.get("mutation")
+        start = raw.get("click") if raw.get("click") is not None else raw.get("armed")
+        in_page = done - start if done is not None and start is not None else None
+        outcome = (raw.get("dialogKind") or "dialog") if dialog else f"mutation:{until[1]}"
+        res = Latency(in_page, end_to_end, bool(raw.get("trusted")), outcome)
+        self.log.info(
+            f"Latency {outcome}: in-page "
+            f"{'n/a' if in_page is None else f'{in_page:.1f}ms'}, end-to-end {end_to_end:.1f}ms"
+            f"{'' if res.trusted else ' (untrusted click)'}"
+        )
+        return res
+
+    def wait_js(self, predicate: str, *args: Any, timeout: float | None = None) -> Any:
+        """Дождаться, пока JS-предикат вернёт truthy-значение, и вернуть его.
+
+        ``predicate`` — исходник JS-функции, которая получает ``args`` и может
+        вызывать ``find(by, value)`` для поиска по локатору. Внутри страницы
+        ставится MutationObserver, ответ приходит сразу при выполнении условия.
+        Если async-скрипт не отработал (навигация, таймаут скрипта), ожидание
+        продолжается обычным опросом — в пределах того же ``timeout``.
+        """
+        to = float(timeout if timeout is not None else self.wait._timeout)
+        deadline = time.monotonic() + to
+        self.log.debug(f"Wait JS ({to}s): {predicate[:60]}")
+        try:
+            res = self.call_async("observe_until", predicate, list(args), int(to * 1000))
+        except (TimeoutException, JavascriptException) as e:
+            left = deadline - time.monotonic()
+            self.log.debug(f"Async wait failed ({e.__class__.__name__}), fallback to polling for {left:.1f}s")
+
+            def check(_driver) -> Any:
+                return self.call("check_once", predicate, list(args))
+
+            if left <= 0:
+                value = check(self.driver)
+                if value:
+                    return value
+                raise TimeoutException(f"JS condition not met in {to}s: {predicate[:80]}")
+            return WebDriverWait(self.driver, left, poll_frequency=0.2).until(check)
+        if res and res.get("ok"):
+            return res.get("value")
+        raise TimeoutException(f"JS condition not met in {to}s: {predicate[:80]}")
+
+    def wait_all(self, *conditions: Locator | str, timeout: float | None = None) -> list:
+        """Дождаться сразу всех условий одним скриптом на проверку.
+
+        Условие — локатор (ждём присутствия элемента) или исходник JS-функции
+        без аргументов (ждём truthy-результата). Возвращает список в порядке
+        условий: WebElement для локаторов, значение функции для предикатов.
+        """
+        specs = [
+            {"js": c} if isinstance(c, str) else {"by": c[0], "value": c[1]}
+            for c in conditions
+        ]
+        return self.wait_js(
+            "(specs) => { const out = [];"
+            " for (const s of specs) {"
+            "  const v = s.js ? compile(s.js)() : find(s.by, s.value);"
+            "  if (!v) return null; out.push(v); }"
+            " return out; }",
+            specs, timeout=timeout,
+        )
+
+    def snapshot(self, spec: Mapping[str, Locator], props: Iterable[str] = ("text",),
+                 attrs: Iterable[str] = ()) -> Dict[str, dict | None]:
+        """Прочитать несколько элементов одним execute_script, без ожиданий.
+
+        ``props``: text, displayed, enabled, rect; ``attrs`` — имена атрибутов.
+        Для каждого имени из ``spec`` возвращает dict с ``element`` (WebElement),
+        запрошенными свойствами и ``attrs``, либо None, если элемент не найден.
+        """
+        loc_spec = {name: [loc[0], loc[1]] for name, loc in spec.items()}
+        return self.call("snapshot", loc_spec, list(props), list(attrs)) or {}
+
+    def wait_text_contains(self, locator: Locator, expected: str, timeout: float | None = None) -> str:
+        return self.wait_js(
+            "(by, value, exp) => { const el = find(by, value); if (!el) return null;"
+            " const t = (el.innerText || el.textContent || '').trim(); return t.includes(exp) ? t : null; }",
+            locator[0], locator[1], expected, timeout=timeout,
+        )
+
+    def wait_text_equals(self, locator: Locator, expected: str, timeout: float | None = None) -> str:
+        return self.wait_js(
+            "(by, value, exp) => { const el = find(by, value); if (!el) return null;"
+            " const t = (el.innerText || el.textContent || '').trim(); return t === exp ? t : null; }",
+            locator[0], locator[1], expected, timeout=timeout,
+        )
+
+    def wait_text_nonempty(self, locator: Locator, timeout: float | None = None) -> str:
+        return self.wait_js(
+            "(by, value) => { const el = find(by, value); if (!el) return null;"
+            " return (el.innerText || el.textContent || '').trim() || null; }",
+            locator[0], locator[1], timeout=timeout,
+        )
+
+    def call(self, name: str, *args: Any) -> Any:
+        """Выполнить скрипт из реестра ``SCRIPTS`` по имени.
+
+        Скрипты ставятся в ``window.__po`` одним execute_script на документ и
+        дальше вызываются по короткому handle: исходник не уходит по сети и не
+        парсится браузером заново. После навигации namespace пропадает — на
+        первом промахе реестр ставится повторно. (``driver.pin_script`` в
+        Selenium 4.15 всё равно пересылает исходник при каждом вызове.)
+        """
+        handle = self._script_handle(name)
+        res = self.driver.execute_script(_JS_CALL, handle, *args)
+        if _is_missing(res):
+            self._install_scripts()
+            res = self.driver.execute_script(_JS_CALL, handle, *args)
+        return res
+
+    def call_async(self, name: str, *args: Any) -> Any:
+        """То же, что ``call``, для скриптов с callback в последнем аргументе."""
+        handle = self._script_handle(name)
+        res = self.driver.execute_async_script(_JS_CALL_ASYNC, handle, *args)
+        if _is_missing(res):
+            self._install_scripts()
+            res = self.driver.execute_async_script(_JS_CALL_ASYNC, handle, *args)
+        return res
+
+    @classmethod
+    def _script_registry(cls) -> Tuple[Dict[str, str], str]:
+        reg = _REGISTRIES.get(cls)
+        if reg is None:
+            handles: Dict[str, str] = {}
+            sources: Dict[str, str] = {}
+            for klass in reversed(cls.__mro__):
+                for name, src in vars(klass).get("SCRIPTS", {}).items():
+                    handle = f"{klass.__name__}.{name}"
+                    handles[name] = handle
+                    sources[handle] = src
+            install = "window.__po = window.__po || {};\n" + "".join(
+                f"window.__po[{json.dumps(h)}] = function () {{\n{src}\n}};\n" for h, src in sources.items()
+            ) + "return true;"
+            reg = _REGISTRIES[cls] = (handles, install)
+        return reg
+
+    def _script_handle(self, name: str) -> str:
+        handles, _ = self._script_registry()
+        if name not in handles:
+            raise ValueError(f"Unknown page script: {name!r}")
+        return handles[name]
+
+    def _install_scripts(self) -> None:
+        handles, install = self._script_registry()
+        self.log.debug(f"Installing {len(handles)} page script(s) into window.__po")
+        self.driver.execute_script(install)
+
     def js(self, script: str, *args: Any):
         self.log.debug(f"Execute JS: {script[:60]}...")
         return self.driver.execute_script(script, *args)
@@ -5,9 +5,8 @@ import allure
 from typing import Dict, Tuple, Optional
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 
-from pages.base_page import BasePage, Locator
+from pages.base_page import BasePage, Latency, Locator, Step
 
 class ClickEventsPage(BasePage):
     DEMO_OUTPUT: Locator = (By.CSS_SELECTOR, "#demo")
@@ -28,6 +27,15 @@ class ClickEventsPage(BasePage):
         "cow": (By.CSS_SELECTOR, "div.wp-block-columns:nth-child(5) > div:nth-child(2) > button:nth-child(1)"),
     }
 
+    SCRIPTS: Dict[str, str] = {
+        "reset_state": """
+            const demo = document.querySelector('#demo');
+            if (!demo) return false;
+            demo.textContent = '';
+            return true;
+        """,
+    }
+
     EXPECTED_MESSAGES: Dict[str, str] = {
         "cat": "Meow!",
         "dog": "Woof!",
@@ -36,10 +44,15 @@ class ClickEventsPage(BasePage):
     }
 
     @allure.step("Открыть Click Events и дождаться готовности")
-    def open_and_ready(self, base_url: str) -> None:
-        self.open(f"{base_url.rstrip('/')}/click-events/")
-        self.find(self.DEMO_OUTPUT)
-        self.find(self._button_locator("cat"))
+    def open_and_ready(self, base_url: str, reuse: Optional[bool] = None) -> None:
+        self.open(f"{base_url.rstrip('/')}/click-events/", reuse=reuse)
+        # #demo и все четыре кнопки — одним ожиданием; локаторы кнопок кешируются на странице
+        spec = {f"button:{k}": self._button_candidates(k) for k in self.EXPECTED_MESSAGES}
+        spec["demo"] = [self.DEMO_OUTPUT]
+        self.resolve_all(spec)
+
+    def reset_state(self) -> bool:
+        return bool(self.call("reset_state"))
 
     @allure.step("Проверить, что открыта страница Click Events")
     def is_open(self, base_url: Optional[str] = None) -> bool:
@@ -58,59 +71,59 @@ class ClickEventsPage(BasePage):
     def click_button(self, name: str) -> None:
         key = name.strip().lower()
         loc = self._button_locator(key)
-        el = self.find(loc)
-        self._scroll_into_view(el)
         try:
-            self.wait_clickable(loc).click()
+            el = self.wait_clickable(loc)
+            self._scroll_into_view(el)
+            el.click()
         except Exception:
-            self.driver.execute_script("arguments[0].click();", el)
+            self.forget(loc)
+            self.driver.execute_script("arguments[0].click();", self.find(loc))
 
     @allure.step("Серия кликов (без пауз) по: {names}")
-    def click_sequence(self, names: list[str]) -> None:
-        for n in names:
-            self.click_button(n)
+    def click_sequence(self, names: list[str], mode: str = "real") -> None:
+        """Все клики одним пакетом: ``real`` — W3C Actions, ``synthetic`` — события из JS."""
+        self.perform([Step.click(self._button_locator(n)) for n in names], mode=mode)
+
+    @allure.step("Замерить задержку реакции #demo на клик: {name}")
+    def measure_click(self, name: str, timeout: Optional[float] = None) -> Latency:
+        """Клик по кнопке и время до первой мутации #demo по часам страницы."""
+        return self.measure_latency(lambda: self.click_button(name), until=self.DEMO_OUTPUT, timeout=timeout)
 
     @allure.step("Дождаться текста в #demo: {expected!r}")
     def wait_message(self, expected: str, timeout: Optional[int] = None) -> str:
-        to = timeout or self.wait._timeout  
-        locator = self.DEMO_OUTPUT
-        self.wait.with_timeout(to).until(EC.text_to_be_present_in_element(locator, expected))
-        return self.get_message()
+        return self.wait_text_contains(self.DEMO_OUTPUT, expected, timeout=timeout)
 
     @allure.step("Прочитать текст из #demo")
     def get_message(self) -> str:
-        return (self.find(self.DEMO_OUTPUT).text or "").strip()
+        return (self._on_element(self.DEMO_OUTPUT, lambda el: el.text) or "").strip()
 
     @allure.step("Проверить, что кнопка отображается и активна: {name}")
     def is_button_displayed_and_enabled(self, name: str) -> bool:
-        el = self.find(self._button_locator(name))
-        return el.is_displayed() and el.is_enabled()
+        return self._on_element(self._button_locator(name), lambda el: el.is_displayed() and el.is_enabled())
 
     @allure.step("Получить видимые тексты всех кнопок")
     def get_all_button_texts(self) -> Dict[str, str]:
-        out: Dict[str, str] = {}
-        for key in ("cat", "dog", "pig", "cow"):
-            try:
-                txt = (self.find(self._button_locator(key)).text or "").strip()
-            except Exception:
-                txt = ""
-            out[key] = txt
-        return out
+        keys = ("cat", "dog", "pig", "cow")
+        snap = self.snapshot({k: self._button_locator(k) for k in keys})
+        return {k: ((snap.get(k) or {}).get("text") or "").strip() for k in keys}
 
     @allure.step("Проверить live-region у #demo (role/aria-live)")
     def get_live_region_attrs(self) -> Tuple[str, str]:
-        el = self.find(self.DEMO_OUTPUT)
-        role = (el.get_attribute("role") or "").strip().lower()
-        aria_live = (el.get_attribute("aria-live") or "").strip().lower()
+        snap = self.snapshot({"demo": self.DEMO_OUTPUT}, props=(), attrs=("role", "aria-live"))
+        attrs = (snap.get("demo") or {}).get("attrs") or {}
+        role = (attrs.get("role") or "").strip().lower()
+        aria_live = (attrs.get("aria-live") or "").strip().lower()
         return role, aria_live
 
     def _button_locator(self, key: str) -> Locator:
         k = key.strip().lower()
-        if k in self._BTN_XPATH_BY_TEXT:
-            return self._BTN_XPATH_BY_TEXT[k]
-        if k in self._BTN_CSS_FALLBACK:
-            return self._BTN_CSS_FALLBACK[k]
-        raise ValueError(f"Unknown button name: {key!r}")
+        return self.resolve_locator(f"button:{k}", self._button_candidates(k))
+
+    def _button_candidates(self, key: str) -> list[Locator]:
+        candidates = [m[key] for m in (self._BTN_XPATH_BY_TEXT, self._BTN_CSS_FALLBACK) if key in m]
+        if not candidates:
+            raise ValueError(f"Unknown button name: {key!r}")
+        return candidates
 
     @allure.step("Получить ожидаемое сообщение для кнопки: {name}")
     def expected_message(self, name: str) -> str:
@@ -2,13 +2,211 @@ from __future__ import annotations
 
 import re
 import allure
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
-from pages.base_page import BasePage, Locator
+from pages.base_page import BasePage, LastResort, Locator
+
+# Индекс доступных имён страницы: текстовые узлы и их rect считаются один раз,
+# сортируются по нижней границе, а «ближайший текст сверху» ищется бинарным
+# поиском. Координаты — документные (rect + scroll), поэтому прокрутка индекс не
+# портит; живёт он в window.__a11yIndex до первой мутации DOM или resize окна.
+# arguments[0] — элемент (вернуть его имя) или null (вернуть имена всех контролов).
+_JS_A11Y_INDEX = r"""
+    const norm = s => (s || '').replace(/\s+/g, ' ').trim().toLowerCase();
+    const getText = n => norm(n ? n.textContent : '');
+
+    let idx = window.__a11yIndex;
+    if (!idx || idx.dirty) {
+        const items = [];
+        document.querySelectorAll('label, p, span, div, h1, h2, h3').forEach((n, i) => {
+            const text = getText(n);
+            if (text) items.push({n, i, text, bottom: n.getBoundingClientRect().bottom + window.scrollY});
+        });
+        // при равной нижней границе выигрывает узел, раньше стоящий в DOM
+        items.sort((a, b) => a.bottom - b.bottom || b.i - a.i);
+        idx = window.__a11yIndex = {dirty: false, items, names: new Map()};
+        const invalidate = () => {
+            idx.dirty = true;
+            obs.disconnect();
+            window.removeEventListener('resize', invalidate);
+        };
+        const obs = new MutationObserver(invalidate);
+        obs.observe(document.documentElement,
+                    {subtree: true, childList: true, characterData: true, attributes: true});
+        // перенос строк при resize меняет раскладку без мутаций DOM
+        window.addEventListener('resize', invalidate);
+    }
+
+    const compute = el => {
+        const lbls = el.labels ? Array.from(el.labels).map(x => getText(x)).filter(Boolean) : [];
+        if (lbls.length) return lbls.join(' ').trim();
+
+        const ariaLabelledby = el.getAttribute('aria-labelledby');
+        if (ariaLabelledby) {
+            const parts = ariaLabelledby.split(/\s+/).map(id => document.getElementById(id)).filter(Boolean);
+            const txt = parts.map(n => getText(n)).filter(Boolean).join(' ').trim();
+            if (txt) return txt;
+        }
+
+        const aria = norm(el.getAttribute('aria-label'));
+        if (aria) return aria;
+
+        let p = el.previousElementSibling, hops = 0;
+        while (p && hops < 3) { const t = getText(p); if (t) return t; p = p.previousElementSibling; hops++; }
+
+        const cont = el.closest('article .entry-content, form, main, body') || document.body;
+        const top = el.getBoundingClientRect().top + window.scrollY;
+        let lo = 0, hi = idx.items.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (idx.items[mid].bottom <= top) lo = mid + 1; else hi = mid;
+        }
+        for (let k = lo - 1; k >= 0; k--) {
+            const n = idx.items[k].n;
+            if (n !== cont && cont.contains(n)) return idx.items[k].text;
+        }
+        return '';
+    };
+    const nameOf = el => {
+        if (!idx.names.has(el)) idx.names.set(el, compute(el));
+        return idx.names.get(el);
+    };
+
+    if (arguments[0]) return nameOf(arguments[0]);
+    const out = {};
+    for (const el of document.querySelectorAll('input, select, textarea, button')) {
+        const key = el.id || el.getAttribute('name');
+        if (key && !(key in out)) out[key] = nameOf(el);
+    }
+    return out;
+"""
+
+# Тексты под блоком «Automation tools»: сначала label, потом li/p/span/div,
+# только отрисованные, с нормализацией пробелов и дедупликацией
+_JS_TOOLS_TEXTS = r"""
+    const lower = "translate(normalize-space(.),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz')";
+    const first = xp => document.evaluate(xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    const h = first(`//*[self::h2 or self::h3 or self::p][contains(${lower}, 'automation tools')]`);
+    const root = h ? (h.closest('.entry-content') || h)
+                   : (document.querySelector('article .entry-content') || document.body);
+
+    const clean = s => (s || '').replace(/\s+/g, ' ').trim();
+    const seen = new Set(), out = [];
+    const collect = sel => {
+        for (const el of root.querySelectorAll(sel)) {
+            if (!el.getClientRects().length) continue;
+            const t = clean(el.innerText);
+            const key = t.toLowerCase();
+            if (!t || seen.has(key)) continue;
+            seen.add(key);
+            out.push(t);
+        }
+    };
+    collect('label');
+    collect('li, p, span, div');
+    return out;
+"""
+
+# Видимые предупреждения по XPath из arguments[0], без повторов
+_JS_VISIBLE_WARNINGS = r"""
+    const res = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const seen = new Set(), out = [];
+    for (let i = 0; i < res.snapshotLength; i++) {
+        const el = res.snapshotItem(i);
+        const st = getComputedStyle(el);
+        if (!el.getClientRects().length || st.visibility === 'hidden' || st.opacity === '0') continue;
+        const t = (el.innerText || '').replace(/\s+/g, ' ').trim();
+        if (!t || seen.has(t)) continue;
+        seen.add(t);
+        out.push(t);
+    }
+    return out;
+"""
+
+
+# Заполнение формы одним скриптом. arguments[0] — payload или null (только прочитать
+# состояние), arguments[1] — известные инструменты (нормализованные). Текст пишется
+# через нативный setter с input/change, чекбоксы/радио переключаются click(),
+# select — через value с input/change. Возвращает {before, after, missing}.
+_JS_FILL_FORM = r"""
+    const payload = arguments[0], known = arguments[1];
+    const selectors = (payload && payload.selectors) || arguments[2] || {};
+    const norm = s => (s || '').replace(/\s+/g, ' ').trim().toLowerCase();
+    const first = sels => { for (const s of sels) { const el = document.querySelector(s); if (el) return el; } return null; };
+    const fire = (el, type) => el.dispatchEvent(new Event(type, {bubbles: true}));
+
+    const toolBoxes = () => {
+        const out = {};
+        for (const lbl of document.querySelectorAll('label')) {
+            const t = norm(lbl.textContent);
+            const box = lbl.control;
+            if (known.includes(t) && box && box.type === 'checkbox' && !(t in out)) out[t] = box;
+        }
+        for (const box of document.querySelectorAll('input[type=checkbox]')) {
+            for (const sib of [box.nextElementSibling, box.previousElementSibling]) {
+                const t = norm(sib && sib.textContent);
+                for (const k of known) if (!(k in out) && t.includes(k)) out[k] = box;
+            }
+        }
+        return out;
+    };
+    const fieldValue = sels => { const el = first(sels); return el ? el.value : null; };
+    const read = () => {
+        const fields = {};
+        for (const [name, sels] of Object.entries(selectors)) {
+            fields[name] = fieldValue(sels);
+        }
+        const boxes = toolBoxes();
+        return {
+            fields,
+            checked: Array.from(document.querySelectorAll('input[type=checkbox]:checked, input[type=radio]:checked'))
+                .map(el => el.id).filter(Boolean),
+            tools: Object.keys(boxes).filter(k => boxes[k].checked),
+            automation: (document.querySelector('#automation') || {}).value || null,
+        };
+    };
+
+    const before = read();
+    if (!payload) return {before, after: before, missing: []};
+
+    const missing = [];
+    for (const [name, text] of Object.entries(payload.text)) {
+        const el = first(selectors[name]);
+        if (!el) { missing.push(name); continue; }
+        const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, text);
+        el.dispatchEvent(new InputEvent('input', {bubbles: true, inputType: 'insertText', data: text}));
+        fire(el, 'change');
+    }
+    for (const [sel, want] of payload.toggles) {
+        const el = document.querySelector(sel);
+        if (!el) { missing.push(sel); continue; }
+        if (el.checked !== want) el.click();
+    }
+    if (payload.automation !== null) {
+        const sel = document.querySelector('#automation');
+        const opt = sel && Array.from(sel.options).find(
+            o => o.value === payload.automation || norm(o.text) === payload.automation);
+        if (!opt) missing.push('automation');
+        else if (sel.value !== opt.value) {
+            sel.value = opt.value;
+            fire(sel, 'input');
+            fire(sel, 'change');
+        }
+    }
+    const boxes = toolBoxes();
+    for (const [tool, want] of Object.entries(payload.tools)) {
+        const box = boxes[tool];
+        if (!box) { missing.push(tool); continue; }
+        if (box.checked !== want) box.click();
+    }
+    return {before, after: read(), missing};
+"""
+
 
 class FormPage(BasePage):
     NAME_INPUT: Locator = (By.CSS_SELECTOR, "#name-input")
@@ -37,12 +235,30 @@ class FormPage(BasePage):
 
     _KNOWN_TOOLS: List[str] = ["selenium", "playwright", "cypress", "appium", "katalon studio"]
 
+    SCRIPTS: Dict[str, str] = {
+        "reset_state": """
+            const form = document.querySelector('#feedbackForm') || document.querySelector('form');
+            if (!form) return false;
+            form.reset();
+            return true;
+        """,
+        "a11y_index": _JS_A11Y_INDEX,
+        "tools_texts": _JS_TOOLS_TEXTS,
+        "visible_warnings": _JS_VISIBLE_WARNINGS,
+        "fill_form": _JS_FILL_FORM,
+    }
+
+    _TEXT_FIELDS = ("name", "password", "email", "message")
+    _FORM_KEYS = _TEXT_FIELDS + ("drink", "color", "automation", "tools")
+
     @allure.step("Открыть Form Fields и дождаться готовности")
-    def open_and_ready(self, base_url: str) -> None:
-        self.open(f"{base_url}/form-fields/")
+    def open_and_ready(self, base_url: str, reuse: bool | None = None) -> None:
+        self.open(f"{base_url}/form-fields/", reuse=reuse)
         from selenium.webdriver.common.by import By
-        self.find((By.TAG_NAME, "body"))
-        self.find(self.NAME_INPUT)
+        self.wait_all((By.TAG_NAME, "body"), self.NAME_INPUT)
+
+    def reset_state(self) -> bool:
+        return bool(self.call("reset_state"))
 
     @allure.step("Проверить, что открыта страница Form Fields")
     def is_open(self, base_url: str | None = None) -> bool:
@@ -67,66 +283,40 @@ class FormPage(BasePage):
     def click_label_for(self, control_id: str) -> None:
         from selenium.webdriver.common.by import By
         css = f"label[for='{control_id}']"
-        lbl = self.driver.find_element(By.CSS_SELECTOR, css)
-        self._scroll_into_view(lbl)
+        loc = (By.CSS_SELECTOR, css)
         try:
-            self.wait_clickable((By.CSS_SELECTOR, css)).click()
+            lbl = self.wait_clickable(loc)
+            self._scroll_into_view(lbl)
+            lbl.click()
         except Exception:
-            self.driver.execute_script("arguments[0].click();", lbl)
+            self.forget(loc)
+            self.driver.execute_script("arguments[0].click();", self.find(loc))
 
     @allure.step("Получить 'доступное имя' или ближайший контекстный текст")
     def get_accessible_name_or_context(self, el) -> str:
-        return self.js(r"""
-            const el = arguments[0];
-
-            const norm = s => (s||'').replace(/\s+/g,' ').trim().toLowerCase();
-            const getText = n => norm(n ? n.textContent : '');
-
-            const lbls = el.labels ? Array.from(el.labels).map(x => getText(x)).filter(Boolean) : [];
-            if (lbls.length) return lbls.join(' ').trim();
-
-            const ariaLabelledby = el.getAttribute('aria-labelledby');
-            if (ariaLabelledby) {
-            const parts = ariaLabelledby.split(/\s+/).map(id => document.getElementById(id)).filter(Boolean);
-            const txt = parts.map(n => getText(n)).filter(Boolean).join(' ').trim();
-            if (txt) return txt;
-            }
-
-            const aria = norm(el.getAttribute('aria-label'));
-            if (aria) return aria;
-
-           let p = el.previousElementSibling, hops = 0;
-            while (p && hops < 3) { const t = getText(p); if (t) return t; p = p.previousElementSibling; hops++; }
-
-            const cont = el.closest('article .entry-content, form, main, body') || document.body;
-            const rect = el.getBoundingClientRect();
-            const nodes = Array.from(cont.querySelectorAll('label, p, span, div, h1, h2, h3'));
-            let best = '', bestDy = Infinity;
-            for (const n of nodes) {
-            const txt = getText(n); if (!txt) continue;
-            const r = n.getBoundingClientRect(); const dy = rect.top - r.bottom;
-            if (dy >= 0 && dy < bestDy) { bestDy = dy; best = txt; }
-            }
-            return best;
-        """, el) or ""
+        return self.call("a11y_index", el) or ""
 
+    @allure.step("Получить доступные имена всех контролов формы")
+    def get_accessible_names(self) -> Dict[str, str]:
+        """id (или name) контрола -> доступное имя/контекст, из того же индекса."""
+        return self.call("a11y_index", None) or {}
 
     @allure.step("Fill Name: {text}")
-    def fill_name(self, text: str) -> None:
-        self.type(self.NAME_INPUT, text)
+    def fill_name(self, text: str, strategy: str = "keys") -> None:
+        self.type(self.NAME_INPUT, text, strategy=strategy)
 
     @allure.step("Fill Password: ••••")
-    def fill_password(self, text: str) -> None:
+    def fill_password(self, text: str, strategy: str = "keys") -> None:
         locator = self._resolve_password_locator()
-        self.type(locator, text)
+        self.type(locator, text, strategy=strategy)
 
     @allure.step("Fill Email: {text}")
-    def fill_email(self, text: str) -> None:
-        self.type(self.EMAIL_INPUT, text)
+    def fill_email(self, text: str, strategy: str = "keys") -> None:
+        self.type(self.EMAIL_INPUT, text, strategy=strategy)
 
     @allure.step("Fill Message")
-    def fill_message(self, text: str) -> None:
-        self.type(self.MESSAGE_TEXTAREA, text)
+    def fill_message(self, text: str, strategy: str = "keys") -> None:
+        self.type(self.MESSAGE_TEXTAREA, text, strategy=strategy)
 
     @allure.step("Select favorite drink: {option}")
     def select_drink(self, option: str) -> None:
@@ -195,20 +385,101 @@ class FormPage(BasePage):
 
         raise NoSuchElementException(f"Checkbox for tool '{tool_name}' not found")
 
-    @allure.step("Collect list of Automation tools from the page")
-    def get_all_tools(self) -> List[str]:
-        root = self._find_tools_container()
-        texts: List[str] = []
+    @allure.step("Заполнить форму целиком")
+    def fill_form(self, data: Dict[str, Any], strategy: str = "value") -> Dict[str, Any]:
+        """Заполнить форму одним скриптом и вернуть снимки до/после.
+
+        Ключи ``data``: name, password, email, message (строки); drink
+        (строка или список из ``_DRINK_IDS``), color (из ``_COLOR_IDS``),
+        automation (value или текст опции), tools (список из ``_KNOWN_TOOLS``
+        или dict инструмент -> отметить/снять). Неизвестные ключи и значения
+        отклоняются ValueError до обращения к браузеру.
+
+        С ``strategy="value"`` всё применяется за один round trip. С ``keys`` /
+        ``insert`` текстовые поля вводятся через ``type()`` этой стратегией,
+        остальное — тем же скриптом.
+
+        Результат: ``{"before": ..., "after": ..., "missing": [...]}``, снимок —
+        значения полей, выбранные напитки/цвет, automation и отмеченные tools;
+        в ``missing`` — то, чего не нашлось на странице.
+        """
+        if strategy not in ("keys", "insert", "value"):
+            raise ValueError(f"Unsupported input strategy: {strategy!r}")
+        unknown = set(data) - set(self._FORM_KEYS)
+        if unknown:
+            raise ValueError(f"Unsupported form keys: {sorted(unknown)}. Allowed: {', '.join(self._FORM_KEYS)}")
+
+        drinks = data.get("drink") or []
+        drinks = [drinks] if isinstance(drinks, str) else list(drinks)
+        toggles = [[self._by_dict_safe(self._DRINK_IDS, d), True] for d in drinks]
+        if data.get("color"):
+            toggles.append([self._by_dict_safe(self._COLOR_IDS, data["color"]), True])
+
+        tools = data.get("tools") or {}
+        if not isinstance(tools, dict):
+            tools = {t: True for t in tools}
+        tools = {self._norm(t): bool(v) for t, v in tools.items()}
+        bad_tools = [t for t in tools if t not in self._KNOWN_TOOLS]
+        if bad_tools:
+            raise ValueError(f"Unsupported tools: {bad_tools}. Allowed: {', '.join(self._KNOWN_TOOLS)}")
+
+        automation = data.get("automation")
+        text = {k: str(data[k]) for k in self._TEXT_FIELDS if data.get(k) is not None}
+        selectors = self._text_field_selectors()
+
+        typed = {}
+        if strategy != "value":
+            typed, text = text, {}
+        payload = {
+            "selectors": selectors,
+            "text": text,
+            "toggles": toggles,
+            "automation": self._norm(automation) if automation is not None else None,
+            "tools": tools,
+        }
+
+        if typed:
+            before = self.call("fill_form", None, self._KNOWN_TOOLS, selectors)["before"]
+            locators = {"name": self.NAME_INPUT, "email": self.EMAIL_INPUT, "message": self.MESSAGE_TEXTAREA}
+            for name, value in typed.items():
+                loc = self._resolve_password_locator() if name == "password" else locators[name]
+                self.type(loc, value, strategy=strategy)
+            res = self.call("fill_form", payload, self._KNOWN_TOOLS)
+            res["before"] = before
+        else:
+            res = self.call("fill_form", payload, self._KNOWN_TOOLS)
 
-        for el in root.find_elements(By.XPATH, ".//label"):
-            t = self._clean_text(el.text)
-            if t:
-                texts.append(t)
+        res["before"] = self._form_state(res["before"])
+        res["after"] = self._form_state(res["after"])
+        if res.get("missing"):
+            self.log.warning(f"fill_form: not found on page: {res['missing']}")
+        return res
 
-        for el in root.find_elements(By.XPATH, ".//li|.//p|.//span|.//div"):
-            t = self._clean_text(el.text)
-            if t:
-                texts.append(t)
+    def _text_field_selectors(self) -> Dict[str, List[str]]:
+        password = self.locator_memo.order(
+            self.__class__.__name__, "password", [self.PASSWORD_INPUT_PRIMARY, self.PASSWORD_INPUT_FALLBACK]
+        )
+        return {
+            "name": [self.NAME_INPUT[1]],
+            "password": [loc[1] for loc in password],
+            "email": [self.EMAIL_INPUT[1]],
+            "message": [self.MESSAGE_TEXTAREA[1]],
+        }
+
+    def _form_state(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        checked = set(raw.get("checked") or [])
+        return {
+            **(raw.get("fields") or {}),
+            "drinks": [k for k, css in self._DRINK_IDS.items() if css.lstrip("#") in checked],
+            "color": next((k for k, css in self._COLOR_IDS.items() if css.lstrip("#") in checked), None),
+            "automation": raw.get("automation"),
+            "tools": list(raw.get("tools") or []),
+        }
+
+    @allure.step("Collect list of Automation tools from the page")
+    def get_all_tools(self) -> List[str]:
+        texts: List[str] = self.call("tools_texts") or []
+        texts = [self._clean_text(t) for t in texts]
 
         seen = set()
         result: List[str] = []
@@ -227,14 +498,13 @@ class FormPage(BasePage):
 
     def visible_warnings(self) -> List[str]:
         lower = "translate(@class,'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz')"
-        elems = self.driver.find_elements(
-            By.XPATH,
+        xpath = (
             f"//*[self::div or self::p or self::span][@role='alert' or "
             f"contains({lower},'warning') or contains({lower},'error') or "
             "contains(translate(normalize-space(text()),"
             " 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'warning')]"
         )
-        return [e.text.strip() for e in elems if e.is_displayed() and e.text.strip()]
+        return self.call("visible_warnings", xpath) or []
 
     @allure.step("Получить текст главного заголовка (H1) страницы")
     def get_h1_text(self) -> str:
@@ -242,24 +512,18 @@ class FormPage(BasePage):
             (By.CSS_SELECTOR, "h1.entry-title"),
             (By.CSS_SELECTOR, "article h1"),
             (By.CSS_SELECTOR, ".pt-1 h1"),
-            (By.XPATH, "//main//h1[normalize-space()]"),
-            (By.XPATH, "//h1[normalize-space()]"),
+            LastResort((By.XPATH, "//main//h1[normalize-space()]")),
+            LastResort((By.XPATH, "//h1[normalize-space()]")),
         ]
-        for by, sel in candidates:
-            try:
-                el = self.driver.find_element(by, sel)
-                txt = (el.text or "").strip()
-                if txt:
-                    return txt
-            except Exception:
-                continue
-        return ""
+        try:
+            return self.resolve("h1", candidates, require_text=True, timeout=0).text
+        except TimeoutException:
+            return ""
 
     def _resolve_password_locator(self) -> Locator:
         try:
-            self.find(self.PASSWORD_INPUT_PRIMARY)
-            return self.PASSWORD_INPUT_PRIMARY
-        except Exception:
+            return self.resolve_locator("password", [self.PASSWORD_INPUT_PRIMARY, self.PASSWORD_INPUT_FALLBACK])
+        except TimeoutException:
             return self.PASSWORD_INPUT_FALLBACK
 
     def _by_dict_safe(self, mapping: Dict[str, str], key: str) -> str:
@@ -269,23 +533,18 @@ class FormPage(BasePage):
         return mapping[k]
 
     def _find_tools_container(self):
-        d = self.driver
-        candidates = d.find_elements(
-            By.XPATH,
-            "//*[self::h2 or self::h3 or self::p]"
+        heading = (
+            "(//*[self::h2 or self::h3 or self::p]"
             "[contains(translate(normalize-space(.),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),"
-            " 'automation tools')]"
+            " 'automation tools')])[1]"
         )
-        if candidates:
-            h = candidates[0]
-            try:
-                return h.find_element(By.XPATH, "./ancestor::*[contains(@class,'entry-content')][1]")
-            except Exception:
-                return h
-        try:
-            return d.find_element(By.CSS_SELECTOR, "article .entry-content")
-        except Exception:
-            return d.find_element(By.TAG_NAME, "body")
+        candidates: list[Locator] = [
+            (By.XPATH, heading + "/ancestor::*[contains(@class,'entry-content')][1]"),
+            (By.XPATH, heading),
+            LastResort((By.CSS_SELECTOR, "article .entry-content")),
+            LastResort((By.TAG_NAME, "body")),
+        ]
+        return self.resolve("tools_container", candidates, timeout=0).element
 
     def _find_label_by_text(self, root, tool_norm: str):
         xpath = (
@@ -2,14 +2,14 @@ from __future__ import annotations
 
 import time
 import allure
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.alert import Alert
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
-from pages.base_page import BasePage, Locator
+from pages.base_page import BasePage, Latency, Locator
 
 
 class PopupsPage(BasePage):
@@ -22,24 +22,58 @@ class PopupsPage(BasePage):
 
     CONFIRM_RESULT: Locator = (By.CSS_SELECTOR, "#confirmResult")
     PROMPT_RESULT: Locator = (By.CSS_SELECTOR, "#promptResult")
+    # Непустой результат confirm/prompt — для негативных проверок
+    FILLED_RESULT: Locator = (By.XPATH, "//*[@id='confirmResult' or @id='promptResult'][normalize-space()]")
 
     TOOLTIP_BTN: Locator = (By.CSS_SELECTOR, ".tooltip_1")
     TOOLTIP: Locator = (By.CSS_SELECTOR, "#myTooltip")
 
+    # Диалоги из DOM не наблюдаются — опрашиваем часто, а не с шагом 0.5 с по умолчанию
+    ALERT_POLL = 0.05
+
+    SCRIPTS: Dict[str, str] = {
+        "reset_state": """
+            const c = document.querySelector('#confirmResult');
+            const p = document.querySelector('#promptResult');
+            if (!c || !p) return false;
+            c.textContent = '';
+            p.textContent = '';
+            const tip = document.querySelector('#myTooltip');
+            if (tip) tip.classList.remove('show');
+            return true;
+        """,
+        "tooltip_visible": """
+            const el = document.querySelector(arguments[0]);
+            if (!el) return false;
+            const s = window.getComputedStyle(el);
+            const vis = s.visibility !== 'hidden';
+            const disp = s.display !== 'none';
+            const op = parseFloat(s.opacity) > 0.01;
+            const box = el.getBoundingClientRect();
+            return !!(vis && disp && op && box.width >= 1 && box.height >= 1);
+        """,
+        "accessible_name": """
+            const el = arguments[0];
+            const aria = el.getAttribute('aria-label');
+            if (aria) return aria.trim();
+            const txt = (el.textContent||'').trim();
+            return txt;
+        """,
+    }
+
     # --- Навигация/готовность ---
     @allure.step("Открыть Popups и дождаться кнопок")
-    def open_and_ready(self, base_url: str) -> None:
-        self.open(f"{base_url.rstrip('/')}/popups/")
-        self.find(self.ALERT_BTN)
-        self.find(self.CONFIRM_BTN)
-        self.find(self.PROMPT_BTN)
+    def open_and_ready(self, base_url: str, reuse: Optional[bool] = None) -> None:
+        self.open(f"{base_url.rstrip('/')}/popups/", reuse=reuse)
+        self.wait_all(self.ALERT_BTN, self.CONFIRM_BTN, self.PROMPT_BTN)
+
+    def reset_state(self) -> bool:
+        return bool(self.call("reset_state"))
 
     @allure.step("Проверить, что открыта страница Popups")
     def is_open(self, base_url: str | None = None) -> bool:
         try:
-            self.find(self.ALERT_BTN)
-            self.find(self.CONFIRM_BTN)
-            self.find(self.PROMPT_BTN)
+            self.wait_all(self.ALERT_BTN, self.CONFIRM_BTN, self.PROMPT_BTN)
         except Exception:
             return False
         if base_url:
@@ -50,13 +84,21 @@ class PopupsPage(BasePage):
         return True
 
     # --- Действия с алертами ---
+    def _expect_alert(self, timeout: float = 3.0) -> Alert:
+        return WebDriverWait(self.driver, timeout, poll_frequency=self.ALERT_POLL).until(EC.alert_is_present())
+
     def _wait_alert(self, timeout: float = 3.0) -> Optional[Alert]:
         try:
-            WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+            self._expect_alert(timeout)
             return self.driver.switch_to.alert
         except Exception:
             return None
 
+    @allure.step("Замерить задержку появления диалога по кнопке {button}")
+    def measure_dialog(self, button: Locator, action: str = "accept", timeout: float = 3.0) -> Latency:
+        """Клик по кнопке и время до вызова alert/confirm/prompt; диалог закрывается ``action``."""
+        return self.measure_latency(lambda: self.click(button), dialog=action, timeout=timeout)
+
     @allure.step("Alert: кликнуть и принять")
     def click_alert_and_accept(self, timeout: float = 3.0) -> Optional[str]:
         self.click(self.ALERT_BTN)
@@ -67,20 +109,6 @@ class PopupsPage(BasePage):
         al.accept()
         return text
 
-    @allure.step("Confirm: кликнуть и выбрать accept={accept}")
-    def click_confirm_and_choose(self, accept: bool = True, timeout: float = 3.0) -> Tuple[Optional[str], str]:
-        self.click(self.CONFIRM_BTN)
-        al = self._wait_alert(timeout)
-        alert_text = None
-        if al:
-            alert_text = al.text
-            if accept:
-                al.accept()
-            else:
-                al.dismiss()
-        txt = self.wait_text_any(self.CONFIRM_RESULT, timeout=timeout) or self.get_confirm_result()
-        return alert_text, txt
-
     @allure.step("Prompt: кликнуть, ввести текст и accept={accept}")
     def click_prompt_and_respond(self, text: str = "", accept: bool = True, timeout: float = 3.0) -> Tuple[Optional[str], str]:
         """
@@ -121,63 +149,58 @@ class PopupsPage(BasePage):
     # --- Результаты на странице ---
     @allure.step("Прочитать текст #confirmResult")
     def get_confirm_result(self) -> str:
-        return (self.find(self.CONFIRM_RESULT).text or "").strip()
+        return (self._on_element(self.CONFIRM_RESULT, lambda el: el.text) or "").strip()
 
     @allure.step("Прочитать текст #promptResult")
     def get_prompt_result(self) -> str:
-        return (self.find(self.PROMPT_RESULT).text or "").strip()
+        return (self._on_element(self.PROMPT_RESULT, lambda el: el.text) or "").strip()
 
     # --- Tooltip ---
     @allure.step("Показать tooltip кликом по кнопке и подождать видимость")
     def show_tooltip(self, timeout: float = 1.5) -> None:
         self.click(self.TOOLTIP_BTN)
         try:
-            WebDriverWait(self.driver, timeout).until(lambda d: self.is_tooltip_visible())
+            # класс show или стили: ответ приходит с первой мутацией, без опроса
+            self.wait_js(
+                "(by, value) => { const el = find(by, value);"
+                " return !!el && (el.classList.contains('show') || isShown(el)); }",
+                *self.TOOLTIP, timeout=timeout,
+            )
         except Exception:
             pass
 
     @allure.step("Tooltip видим?")
     def is_tooltip_visible(self) -> bool:
         try:
-            el = self.find(self.TOOLTIP)
+            return bool(self.call("tooltip_visible", self.TOOLTIP[1]))
         except Exception:
-            return False
+            pass
         try:
-            visible = self.js("""
-                const el = arguments[0];
-                const s = window.getComputedStyle(el);
-                const vis = s.visibility !== 'hidden';
-                const disp = s.display !== 'none';
-                const op = parseFloat(s.opacity) > 0.01;
-                const box = el.getBoundingClientRect();
-                return !!(vis && disp && op && box.width >= 1 && box.height >= 1);
-            """, el)
-            return bool(visible)
+            return self._on_element(self.TOOLTIP, lambda el: el.is_displayed())
         except Exception:
-            return el.is_displayed()
+            return False
 
     @allure.step("Прочитать текст tooltip (#myTooltip)")
     def get_tooltip_text(self) -> str:
         try:
-            return (self.find(self.TOOLTIP).text or "").strip()
+            return (self._on_element(self.TOOLTIP, lambda el: el.text) or "").strip()
         except Exception:
             return ""
 
     def _wait_confirm_result(self, expected: str, timeout: float = 3.0) -> str:
         expected = (expected or "").strip()
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: (self.get_confirm_result() or "").strip() == expected
-            )
+            return self.wait_text_equals(self.CONFIRM_RESULT, expected, timeout=timeout)
         except TimeoutException:
             pass
         return (self.get_confirm_result() or "").strip()
 
+    @allure.step("Confirm: кликнуть и выбрать accept={accept}")
     def click_confirm_and_choose(self, accept: bool = True) -> tuple[str, str]:
         """Надёжно кликает Confirm и возвращает (action, text)."""
         # текущее значение нам не важно — ждём именно ожидаемое после клика
         self.click(self.CONFIRM_BTN)
-        alert = WebDriverWait(self.driver, 2.5).until(EC.alert_is_present())
+        alert = self._expect_alert(2.5)
         expected = "OK it is!" if accept else "Cancel it is!"
         (alert.accept if accept else alert.dismiss)()
 
@@ -187,38 +210,32 @@ class PopupsPage(BasePage):
         if txt != expected:
             # повторно вызовем confirm с тем же действием
             self.click(self.CONFIRM_BTN)
-            alert = WebDriverWait(self.driver, 2.5).until(EC.alert_is_present())
+            alert = self._expect_alert(2.5)
             (alert.accept if accept else alert.dismiss)()
             txt = self._wait_confirm_result(expected, timeout=3.0)
 
         return ("accept" if accept else "dismiss"), txt
     
     def button_accessible_name(self, locator: Locator) -> str:
-        el = self.find(locator)
-        name = self.js("""
-            const el = arguments[0];
-            const aria = el.getAttribute('aria-label');
-            if (aria) return aria.trim();
-            const txt = (el.textContent||'').trim();
-            return txt;
-        """, el) or ""
+        name = self._on_element(locator, lambda el: self.call("accessible_name", el)) or ""
         return name.strip()
 
     def tooltip_accessibility_ok(self) -> bool:
         """True, если #myTooltip имеет role=tooltip и привязан через aria-describedby."""
         try:
-            btn = self.find(self.TOOLTIP_BTN)
-            t = self.find(self.TOOLTIP)
+            snap = self.snapshot({"btn": self.TOOLTIP_BTN, "tip": self.TOOLTIP},
+                                 props=(), attrs=("role", "aria-describedby", "id"))
         except Exception:
             return False
-        role = (t.get_attribute("role") or "").strip().lower()
-        desc = (btn.get_attribute("aria-describedby") or "").strip()
-        tid = (t.get_attribute("id") or "").strip()
+        if not snap.get("btn") or not snap.get("tip"):
+            return False
+        role = (snap["tip"]["attrs"].get("role") or "").strip().lower()
+        desc = (snap["btn"]["attrs"].get("aria-describedby") or "").strip()
+        tid = (snap["tip"]["attrs"].get("id") or "").strip()
         return (role == "tooltip") and (tid and desc and tid in desc)
 
     def wait_text_any(self, locator: Locator, timeout: float = 2.0) -> str:
         try:
-            WebDriverWait(self.driver, timeout).until(lambda d: (d.find_element(*locator).text or "").strip() != "")
-            return (self.find(locator).text or "").strip()
+            return self.wait_text_nonempty(locator, timeout=timeout) or ""
         except Exception:
             return ""
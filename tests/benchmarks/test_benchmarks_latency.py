@@ -0,0 +1,41 @@
+from __future__ import annotations
+import pytest
+import allure
+
+from pages.click_events import ClickEventsPage
+from pages.popups_page import PopupsPage
+
+@pytest.mark.benchmark
+@allure.feature("Benchmarks")
+@allure.story("Latency")
+class TestLatencyBenchmarks:
+
+    @pytest.mark.parametrize("animal", ["cat", "dog", "pig", "cow"])
+    @allure.title("[BENCH] Click Events: клик → обновление #demo")
+    def test_click_events_button(self, driver, base_url, wait_timeout, benchmark, animal):
+        page = ClickEventsPage(driver, wait_timeout)
+        page.open_and_ready(base_url)
+
+        res = benchmark(f"click-events:{animal}", lambda: page.measure_click(animal).in_page_ms)
+        assert not res.regressed, res.describe()
+
+    @pytest.mark.parametrize("dialog", ["alert", "confirm", "prompt"])
+    @allure.title("[BENCH] Popups: клик → появление диалога")
+    def test_popups_dialog(self, driver, base_url, wait_timeout, benchmark, dialog):
+        page = PopupsPage(driver, wait_timeout)
+        page.open_and_ready(base_url)
+        button = {"alert": page.ALERT_BTN, "confirm": page.CONFIRM_BTN, "prompt": page.PROMPT_BTN}[dialog]
+
+        res = benchmark(f"popups:{dialog}", lambda: page.measure_dialog(button, action="dismiss").in_page_ms)
+        assert not res.regressed, res.describe()
+
+    @allure.title("[BENCH] Popups: клик → переключение tooltip")
+    def test_popups_tooltip(self, driver, base_url, wait_timeout, benchmark):
+        page = PopupsPage(driver, wait_timeout)
+        page.open_and_ready(base_url)
+
+        res = benchmark(
+            "popups:tooltip",
+            lambda: page.measure_latency(lambda: page.click(page.TOOLTIP_BTN), until=page.TOOLTIP).in_page_ms,
+        )
+        assert not res.regressed, res.describe()
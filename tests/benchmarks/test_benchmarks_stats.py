@@ -0,0 +1,78 @@
+from __future__ import annotations
+import json
+import math
+import pytest
+import allure
+
+from utils.benchmark import BenchmarkSuite, mann_whitney_u, merge_worker_files, percentile, summarize
+
+@allure.feature("Benchmarks")
+@allure.story("Statistics")
+class TestBenchmarkStatistics:
+    """Статистика, по которой бенчмарк роняет CI; браузер не нужен."""
+
+    @allure.title("percentile: линейная интерполяция, пустая выборка — ValueError")
+    def test_percentile(self):
+        data = [4, 1, 3, 2]
+        assert percentile(data, 0) == 1
+        assert percentile(data, 50) == 2.5
+        assert percentile(data, 90) == pytest.approx(3.7)
+        assert percentile(data, 100) == 4
+        with pytest.raises(ValueError):
+            percentile([], 50)
+
+    @allure.title("Mann-Whitney U: поправка на связки")
+    def test_mann_whitney_ties_correction(self):
+        # ранги: 1 | 2,2,2 -> 3 | 3,3 -> 5.5; R(current) = 1 + 3 + 3 = 7, U = 7 - 6 = 1
+        u, p = mann_whitney_u([1, 2, 2], [2, 3, 3])
+        assert u == 1
+        # sigma^2 = n1*n2/12 * ((n + 1) - sum(t^3 - t) / (n(n - 1))) = 9/12 * (7 - 30/30) = 4.5
+        z = (1 - 4.5 - 0.5) / math.sqrt(4.5)
+        assert p == pytest.approx(0.5 * math.erfc(z / math.sqrt(2)))
+        z_uncorrected = (1 - 4.5 - 0.5) / math.sqrt(9 / 12 * 7)
+        assert p != pytest.approx(0.5 * math.erfc(z_uncorrected / math.sqrt(2)))
+
+    @allure.title("Mann-Whitney U: одинаковые выборки -> p=0.5")
+    def test_mann_whitney_identical_samples(self):
+        u, p = mann_whitney_u([12.5] * 10, [12.5] * 10)
+        assert u == 50
+        assert p == 0.5
+
+    @allure.title("compare: заметно медленнее -> p < alpha и regressed")
+    def test_compare_detects_regression(self, tmp_path):
+        suite = BenchmarkSuite(tmp_path, alpha=0.01, min_effect=0.1)
+        baseline = [100 + i for i in range(20)]
+        slower = [150 + i for i in range(20)]
+
+        cmp = suite.compare(slower, baseline)
+        assert cmp.p_value < suite.alpha
+        assert cmp.effect == pytest.approx(159.5 / 109.5 - 1)
+        assert cmp.regressed is True
+
+        same = suite.compare(baseline, baseline)
+        assert same.p_value >= suite.alpha
+        assert same.regressed is False
+
+    @allure.title("merge_worker_files: замеры воркеров склеиваются, файлы воркеров удаляются")
+    def test_merge_worker_files(self, tmp_path):
+        parts = {
+            "chrome.gw0.json": {"x": [1.0, 2.0]},
+            "chrome.gw1.json": {"x": [3.0], "y": [4.0]},
+        }
+        for name, results in parts.items():
+            data = {
+                "browser": "chrome",
+                "warmup": 3,
+                "iterations": 20,
+                "results": {k: {"stats": summarize(v), "samples": v} for k, v in results.items()},
+            }
+            (tmp_path / name).write_text(json.dumps(data), encoding="utf-8")
+
+        merged = merge_worker_files(tmp_path)
+
+        assert merged == [tmp_path / "chrome.json"]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["chrome.json"]
+        results = json.loads((tmp_path / "chrome.json").read_text(encoding="utf-8"))["results"]
+        assert results["x"]["samples"] == [1.0, 2.0, 3.0]
+        assert results["x"]["stats"]["n"] == 3
+        assert results["y"]["samples"] == [4.0]
@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-import time
 import pytest
 import allure
-from selenium.webdriver.support import expected_conditions as EC
 
 from pages.click_events import ClickEventsPage
 
@@ -21,14 +19,18 @@ def test_buttons_are_clickable_and_demo_updates_fast(driver, base_url, wait_time
         with allure.step(f"{animal.title()}: проверка кликабельности и скорости реакции"):
             assert page.is_button_displayed_and_enabled(animal), f"Кнопка {animal} не кликабельна"
 
-            start = time.monotonic()
-            page.click_button(animal)
-            page.wait.until(
-                EC.text_to_be_present_in_element(page.DEMO_OUTPUT, expected)
+            lat = page.measure_click(animal)
+            page.wait_message(expected)
+            in_page = "n/a" if lat.in_page_ms is None else f"{lat.in_page_ms:.1f} ms"
+            allure.attach(
+                f"in-page: {in_page}\nend-to-end: {lat.end_to_end_ms:.1f} ms\ntrusted click: {lat.trusted}",
+                f"latency_{animal}", allure.attachment_type.TEXT,
             )
-            dur_ms = (time.monotonic() - start) * 1000
-            allure.attach(f"{dur_ms:.1f} ms", f"latency_{animal}", allure.attachment_type.TEXT)
-            assert dur_ms <= 500, f"{animal}: сообщение появилось слишком долго ({dur_ms:.1f} ms > 500 ms)"
+            assert lat.in_page_ms is not None, \
+                f"{animal}: in-page timing unavailable (end-to-end {lat.end_to_end_ms:.1f} ms)"
+            # гейт — по часам страницы: без HTTP-вызовов WebDriver и шага опроса
+            assert lat.in_page_ms <= 500, \
+                f"{animal}: сообщение появилось слишком долго ({lat.in_page_ms:.1f} ms > 500 ms)"
 
 @pytest.mark.regression
 @allure.feature("Click Events")
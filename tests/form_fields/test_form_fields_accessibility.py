@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import pytest
 import allure
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
+from pages.base_page import Step
 from pages.form_fields import FormPage
 
 @pytest.mark.regression
@@ -24,10 +24,11 @@ def test_accessible_labels_and_keyboard_submit(driver, base_url, wait_timeout):
     }
 
     with allure.step("Проверить наличие доступного имени (или ближайшего контекстного текста)"):
+        # имена всех контролов — одним вызовом из индекса страницы
+        names = page.get_accessible_names()
         missing = []
         for el_id, expected in expectations.items():
-            el = driver.find_element(By.ID, el_id)
-            name_or_ctx = (page.get_accessible_name_or_context(el) or "").lower()
+            name_or_ctx = (names.get(el_id) or "").lower()
             if expected not in name_or_ctx:
                 missing.append((el_id, name_or_ctx))
 
@@ -37,10 +38,11 @@ def test_accessible_labels_and_keyboard_submit(driver, base_url, wait_timeout):
             assert not missing, f"Нет доступного имени для: {missing!r}"
 
     with allure.step("Сабмит доступен с клавиатуры (Enter по кнопке)"):
-        driver.find_element(*page.NAME_INPUT).send_keys("A11y User")
-        driver.find_element(*page.EMAIL_INPUT).send_keys("a11y@example.com")
-        driver.find_element(*page.MESSAGE_TEXTAREA).send_keys("hello")
-        btn = driver.find_element(*page.SUBMIT_BTN)
-        btn.send_keys(Keys.ENTER)
+        page.perform([
+            Step.type(page.NAME_INPUT, "A11y User"),
+            Step.type(page.EMAIL_INPUT, "a11y@example.com"),
+            Step.type(page.MESSAGE_TEXTAREA, "hello"),
+            Step.press(Keys.ENTER, page.SUBMIT_BTN),
+        ])
         alert_text = page.accept_alert_if_present(timeout=5)
         assert alert_text and "message received" in alert_text.lower()
\ No newline at end of file
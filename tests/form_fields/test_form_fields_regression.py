@@ -42,7 +42,8 @@ def test_form_fill_and_submit_with_tools_list(driver, base_url, wait_timeout):
     with allure.step("Сформировать Message из списка 'Automation tools' на странице"):
         tools = page.get_all_tools()
         msg = "\n".join(tools) if tools else "No tools found on page"
-        page.fill_message(msg)
+        # длинный текст: вставляем целиком, посимвольный набор покрывают другие тесты
+        page.fill_message(msg, strategy="insert")
 
     with allure.step("Ввести валидный Email"):
         epoch = int(time.time())
@@ -59,4 +60,44 @@ def test_form_fill_and_submit_with_tools_list(driver, base_url, wait_timeout):
     with allure.step("Валидация: нет видимых предупреждений и URL не изменился"):
         visible_warnings = page.visible_warnings()
         assert not visible_warnings
-        assert "/form-fields" in driver.current_url
\ No newline at end of file
+        assert "/form-fields" in driver.current_url
+
+@pytest.mark.regression
+@allure.feature("Form Fields")
+@allure.story("Regression")
+@allure.title("[Form] fill_form: заполнение одним скриптом, снимки до/после, отказ на неизвестных данных")
+def test_form_fields_fill_form(driver, base_url, wait_timeout, monkeypatch):
+    page = FormPage(driver, wait_timeout)
+    page.open_and_ready(base_url)
+    assert page.is_open(base_url)
+
+    with allure.step("Неизвестные ключи/значения отклоняются ValueError без обращения к браузеру"):
+        commands = []
+        real_execute = driver.execute
+        monkeypatch.setattr(driver, "execute", lambda *a, **kw: commands.append(a[0]) or real_execute(*a, **kw))
+        for bad in ({"nickname": "x"}, {"drink": "Tea"}, {"color": "Purple"}, {"tools": ["Watir"]}):
+            with pytest.raises(ValueError):
+                page.fill_form(bad)
+        with pytest.raises(ValueError):
+            page.fill_form({"name": "x"}, strategy="paste")
+        assert not commands, f"До отказа ушли команды WebDriver: {commands}"
+        monkeypatch.undo()
+
+    with allure.step("Заполнить текстовые поля и выборы одним скриптом"):
+        res = page.fill_form({
+            "name": "Fill Form",
+            "email": "fill@example.com",
+            "message": "fill_form",
+            "drink": "Milk",
+            "color": "Blue",
+            "automation": "Yes",
+        })
+
+    with allure.step("Проверить missing и снимки до/после"):
+        before, after = res["before"], res["after"]
+        assert not res["missing"], f"На странице не нашлись: {res['missing']}"
+        assert before["name"] == "" and before["drinks"] == [], f"Форма до заполнения не пуста: {before}"
+        assert after["name"] == "Fill Form" and after["email"] == "fill@example.com", f"Поля не заполнены: {after}"
+        assert after["message"] == "fill_form", f"Message не заполнен: {after}"
+        assert after["drinks"] == ["milk"] and after["color"] == "blue", f"Выбор не применён: {after}"
+        assert after["automation"] == "yes", f"Automation не выбран: {after['automation']}"
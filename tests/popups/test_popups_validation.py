@@ -16,9 +16,13 @@ class TestPopupsValidation:
 
         before_c = page.get_confirm_result()
         before_p = page.get_prompt_result()
+        assert page.is_absent_now(page.FILLED_RESULT), "Результаты confirm/prompt не пусты до алерта"
 
         page.click_alert_and_accept()
 
+        # негативная проверка: результат не появляется и с задержкой отрисовки
+        page.assert_stays_absent(page.FILLED_RESULT, duration=1.0)
+
         after_c = page.get_confirm_result()
         after_p = page.get_prompt_result()
 
@@ -38,7 +42,7 @@ class TestPopupsValidation:
             f"Ожидали увидеть {expected_fragment!r} в видимом тексте результата, получили: {visible_text!r}"
         )
 
-        inner_html = page.find(page.PROMPT_RESULT).get_attribute("innerHTML") or ""
+        inner_html = page.get_attribute(page.PROMPT_RESULT, "innerHTML") or ""
 
         tags = re.findall(r"<\s*/?\s*([a-z0-9]+)([^>]*)>", inner_html, flags=re.I)
         allow_tags = {"b", "strong", "i", "em"} 
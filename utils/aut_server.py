@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import Dict
+
+from utils.local_server import LocalServer, QuietHandler
+
+# Общий каркас страниц: те же классы/вложенность, что у WordPress-темы стенда
+# (h1.entry-title внутри .pt-1, контент в article .entry-content)
+_LAYOUT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>__TITLE__ | Practice Automation (synthetic)</title>
+<style>
+  body { font-family: sans-serif; margin: 0; }
+  main { padding: 16px 32px; }
+  .wp-block-columns { display: flex; gap: 16px; margin: 8px 0; }
+  button { padding: 8px 16px; }
+  #myTooltip { visibility: hidden; opacity: 0; }
+  #myTooltip.show { visibility: visible; opacity: 1; }
+  label { display: block; margin-top: 8px; }
+</style>
+<script>
+  window.__aut = __CONFIG__;
+  // Рендер с инъекцией задержки: имитируем медленную отрисовку результата
+  function autRender(fn) {
+    var d = window.__aut.renderDelay;
+    if (d > 0) { setTimeout(fn, d); } else { fn(); }
+  }
+  // Нативные диалоги с инъекцией задержки или «пропажи» алерта
+  function autDialog(fn) {
+    if (window.__aut.dropAlerts) { return; }
+    var d = window.__aut.alertDelay;
+    if (d > 0) { setTimeout(fn, d); } else { fn(); }
+  }
+</script>
+</head>
+<body>
+<main id="main">
+  <div class="pt-1"><h1 class="entry-title">__TITLE__</h1></div>
+  <article><div class="entry-content">
+__CONTENT__
+  </div></article>
+</main>
+</body>
+</html>
+"""
+
+_CLICK_EVENTS = """
+    <p>Click on the buttons below to hear the animal sounds.</p>
+    <p>Each button updates the text below.</p>
+    <div class="wp-block-columns">
+      <div><div><div>
+        <div><button onclick="say('Meow!')">Cat</button></div>
+        <div><button onclick="say('Woof!')">Dog</button></div>
+      </div></div></div>
+    </div>
+    <p>More animals:</p>
+    <div class="wp-block-columns">
+      <div><button onclick="say('Oink!')">Pig</button></div>
+      <div><button onclick="say('Moo!')">Cow</button></div>
+    </div>
+    <h2 id="demo"></h2>
+    <script>
+      function say(text) { autRender(function () { document.getElementById('demo').textContent = text; }); }
+    </script>
+"""
+
+_POPUPS = """
+    <p>Click the buttons below to trigger popups.</p>
+    <p><button id="alert" onclick="autDialog(function () { alert('Hi there, pal!'); })">Alert Popup</button></p>
+    <p><button id="confirm" onclick="doConfirm()">Confirm Popup</button></p>
+    <p id="confirmResult"></p>
+    <p><button id="prompt" onclick="doPrompt()">Prompt Popup</button></p>
+    <p id="promptResult"></p>
+    <div class="tooltip_1" aria-describedby="myTooltip" onclick="toggleTip()">Tooltip
+      <span id="myTooltip" role="tooltip">Cool text</span>
+    </div>
+    <script>
+      function doConfirm() {
+        autDialog(function () {
+          var ok = confirm('OK or Cancel, which will it be?');
+          autRender(function () {
+            document.getElementById('confirmResult').textContent = ok ? 'OK it is!' : 'Cancel it is!';
+          });
+        });
+      }
+      function doPrompt() {
+        autDialog(function () {
+          var name = prompt('Hi there, what\\'s your name?');
+          autRender(function () {
+            document.getElementById('promptResult').innerHTML =
+              (name === null || name === '') ? 'Fine, be that way...' : 'Nice to meet you, ' + renderName(name) + '!';
+          });
+        });
+      }
+      // Как на стенде: имя выводится разметкой — простые теги форматирования
+      // отрисовываются, всё остальное экранируется
+      function renderName(name) {
+        var esc = name.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;')
+          .replace(/"/g, '&quot;').replace(/'/g, '&#39;');
+        return esc.replace(/&lt;(\/?)(b|strong|i|em)&gt;/gi, '<$1$2>');
+      }
+      function toggleTip() { document.getElementById('myTooltip').classList.toggle('show'); }
+    </script>
+"""
+
+_FORM_FIELDS = """
+    <form id="feedbackForm" onsubmit="return submitForm(event)">
+      <label for="name-input">Name</label>
+      <input id="name-input" type="text" name="name-input">
+      <label><input type="password" name="password">Password</label>
+      <p>What is your favorite drink?</p>
+      <input type="checkbox" id="drink1" value="Water"><label for="drink1">Water</label>
+      <input type="checkbox" id="drink2" value="Milk"><label for="drink2">Milk</label>
+      <input type="checkbox" id="drink3" value="Coffee"><label for="drink3">Coffee</label>
+      <input type="checkbox" id="drink4" value="Wine"><label for="drink4">Wine</label>
+      <input type="checkbox" id="drink5" value="Ctrl-Alt-Delight"><label for="drink5">Ctrl-Alt-Delight</label>
+      <p>What is your favorite color?</p>
+      <input type="radio" id="color1" name="fav_color" value="Red"><label for="color1">Red</label>
+      <input type="radio" id="color2" name="fav_color" value="Blue"><label for="color2">Blue</label>
+      <input type="radio" id="color3" name="fav_color" value="Green"><label for="color3">Green</label>
+      <input type="radio" id="color4" name="fav_color" value="#FFC0CB"><label for="color4">#FFC0CB</label>
+      <label for="automation">Do you like automation?</label>
+      <select id="automation" name="automation">
+        <option value="default">Choose an option</option>
+        <option value="yes">Yes</option>
+        <option value="no">No</option>
+        <option value="undecided">Undecided</option>
+      </select>
+      <p>Automation tools</p>
+      <ul>
+        <li>Selenium</li>
+        <li>Playwright</li>
+        <li>Cypress</li>
+        <li>Appium</li>
+        <li>Katalon Studio</li>
+      </ul>
+      <label for="email">Email</label>
+      <input id="email" type="email" name="email">
+      <label for="message">Message</label>
+      <textarea id="message" name="message"></textarea>
+      <button id="submit-btn" type="submit">Submit</button>
+    </form>
+    <script>
+      function submitForm(e) {
+        e.preventDefault();
+        autDialog(function () { alert('Message received!'); });
+        return false;
+      }
+    </script>
+"""
+
+_INDEX = """
+    <ul>
+      <li><a href="/click-events/">Click Events</a></li>
+      <li><a href="/popups/">Popups</a></li>
+      <li><a href="/form-fields/">Form Fields</a></li>
+    </ul>
+"""
+
+PAGES: Dict[str, tuple[str, str]] = {
+    "/": ("Practice Automation", _INDEX),
+    "/click-events/": ("Click Events", _CLICK_EVENTS),
+    "/popups/": ("Popups", _POPUPS),
+    "/form-fields/": ("Form Fields", _FORM_FIELDS),
+}
+
+
+class SyntheticAutServer(LocalServer):
+    """Локальная синтетическая копия страниц Click Events, Popups и Form Fields.
+
+    Повторяет DOM-контракты ``ClickEventsPage``, ``PopupsPage`` и ``FormPage``
+    и позволяет инжектировать нагрузку:
+
+    * ``render_delay_ms`` — задержка отрисовки результата (#demo, #confirmResult, #promptResult);
+    * ``network_delay_ms`` — задержка каждого HTTP-ответа сервера;
+    * ``alert_delay_ms`` — задержка появления alert/confirm/prompt;
+    * ``drop_alerts`` — диалоги не появляются вовсе.
+
+    Настройки можно менять на лету через ``configure()``; страница подхватит
+    их при следующей загрузке.
+    """
+
+    def __init__(self, render_delay_ms: int = 0, network_delay_ms: int = 0,
+                 alert_delay_ms: int = 0, drop_alerts: bool = False, port: int = 0):
+        super().__init__(_AutHandler, port=port)
+        self._lock = threading.Lock()
+        self.render_delay_ms = 0
+        self.network_delay_ms = 0
+        self.alert_delay_ms = 0
+        self.drop_alerts = False
+        self.configure(render_delay_ms=render_delay_ms, network_delay_ms=network_delay_ms,
+                       alert_delay_ms=alert_delay_ms, drop_alerts=drop_alerts)
+
+    def configure(self, **knobs) -> None:
+        with self._lock:
+            for name, value in knobs.items():
+                if not hasattr(self, name) or name.startswith("_"):
+                    raise ValueError(f"Unknown AUT knob: {name}")
+                setattr(self, name, bool(value) if name == "drop_alerts" else max(0, int(value)))
+        self.log.info(
+            f"Synthetic AUT: render={self.render_delay_ms}ms network={self.network_delay_ms}ms "
+            f"alert={self.alert_delay_ms}ms drop_alerts={self.drop_alerts}"
+        )
+
+    def render(self, path: str) -> bytes | None:
+        page = PAGES.get(path) or PAGES.get(path.rstrip("/") + "/")
+        if page is None:
+            return None
+        title, content = page
+        with self._lock:
+            config = {
+                "renderDelay": self.render_delay_ms,
+                "alertDelay": self.alert_delay_ms,
+                "dropAlerts": self.drop_alerts,
+            }
+        html = (_LAYOUT.replace("__CONFIG__", json.dumps(config))
+                .replace("__TITLE__", title)
+                .replace("__CONTENT__", content))
+        return html.encode("utf-8")
+
+
+class _AutHandler(QuietHandler):
+    def do_GET(self) -> None:
+        srv: SyntheticAutServer = self.server.owner
+        if srv.network_delay_ms:
+            time.sleep(srv.network_delay_ms / 1000)
+
+        path = self.path.split("?", 1)[0]
+        if path == "/favicon.ico":
+            self.send_body(204, [], b"")
+            return
+        body = srv.render(path)
+        if body is None:
+            self.send_body(404, [("Content-Type", "text/plain; charset=utf-8")], b"Not found")
+            return
+        self.send_body(200, [("Content-Type", "text/html; charset=utf-8"), ("Cache-Control", "no-store")], body)
+
+    do_HEAD = do_GET
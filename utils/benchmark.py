@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from utils.logger import Logger
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Перцентиль с линейной интерполяцией (как numpy.percentile по умолчанию)."""
+    if not samples:
+        raise ValueError("No samples")
+    data = sorted(samples)
+    pos = (len(data) - 1) * q / 100
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(data) - 1)
+    return data[lo] + (data[hi] - data[lo]) * (pos - lo)
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    return {
+        "n": len(samples),
+        "min": min(samples),
+        "p50": percentile(samples, 50),
+        "p90": percentile(samples, 90),
+        "p99": percentile(samples, 99),
+        "max": max(samples),
+        "mean": sum(samples) / len(samples),
+    }
+
+
+def mann_whitney_u(current: Sequence[float], baseline: Sequence[float]) -> Tuple[float, float]:
+    """U-статистика для ``current`` и одностороннее p-value гипотезы «current медленнее».
+
+    Нормальная аппроксимация с поправками на связки и на непрерывность;
+    для выборок от ~8 замеров на сторону её точности хватает.
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        raise ValueError("Both samples must be non-empty")
+    pooled = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    n = n1 + n2
+    rank_sum = 0.0
+    ties = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        avg_rank = (i + j) / 2 + 1
+        rank_sum += avg_rank * sum(1 for k in range(i, j + 1) if pooled[k][1] == 0)
+        t = j - i + 1
+        ties += t ** 3 - t
+        i = j + 1
+
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mu = n1 * n2 / 2
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))) if n > 1 else 0.0
+    if sigma == 0:
+        return u, 0.5
+    z = (u - mu - 0.5) / sigma
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def load_results(directory: str | os.PathLike, browser: str) -> Dict[str, dict]:
+    """Результаты браузера из ``<browser>.json`` и файлов воркеров ``<browser>.<worker>.json``.
+
+    Замеры одного бенчмарка из нескольких файлов склеиваются, статистика
+    пересчитывается по объединённой выборке.
+    """
+    samples: Dict[str, List[float]] = {}
+    for path in sorted(Path(directory).glob(f"{browser}.json")) + sorted(Path(directory).glob(f"{browser}.*.json")):
+        try:
+            results = json.loads(path.read_text(encoding="utf-8")).get("results", {})
+        except (OSError, ValueError):
+            continue
+        for name, res in results.items():
+            samples.setdefault(name, []).extend(res.get("samples") or [])
+    return {name: {"stats": summarize(s), "samples": s} for name, s in samples.items() if s}
+
+
+def merge_worker_files(directory: str | os.PathLike) -> List[Path]:
+    """Слить ``<browser>.<worker>.json`` после xdist-прогона в ``<browser>.json``; файлы воркеров удаляются."""
+    directory = Path(directory)
+    by_browser: Dict[str, List[Path]] = {}
+    for path in directory.glob("*.*.json"):
+        by_browser.setdefault(path.name.split(".", 1)[0], []).append(path)
+    merged: List[Path] = []
+    for browser, parts in by_browser.items():
+        data: dict = {"browser": browser, "created": datetime.now(timezone.utc).isoformat(), "results": {}}
+        for path in sorted(parts):
+            try:
+                part = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            data.setdefault("warmup", part.get("warmup"))
+            data.setdefault("iterations", part.get("iterations"))
+            for name, res in part.get("results", {}).items():
+                prev = data["results"].get(name)
+                if prev:
+                    prev["samples"] = prev["samples"] + res.get("samples", [])
+                    prev["stats"] = summarize(prev["samples"])
+                else:
+                    data["results"][name] = res
+        target = directory / f"{browser}.json"
+        target.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        for path in parts:
+            path.unlink(missing_ok=True)
+        merged.append(target)
+    return merged
+
+
+class Comparison(NamedTuple):
+    p_value: float
+    # отношение медиан текущего прогона и baseline минус 1: 0.25 — на 25% медленнее
+    effect: float
+    regressed: bool
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    browser: str
+    stats: Dict[str, float]
+    samples: List[float]
+    comparison: Optional[Comparison]
+
+    @property
+    def regressed(self) -> bool:
+        return bool(self.comparison and self.comparison.regressed)
+
+    def describe(self) -> str:
+        s = self.stats
+        text = (f"{self.browser} {self.name}: n={s['n']} p50={s['p50']:.1f}ms p90={s['p90']:.1f}ms "
+                f"p99={s['p99']:.1f}ms max={s['max']:.1f}ms")
+        if self.comparison is None:
+            return text + " (no baseline)"
+        c = self.comparison
+        verdict = "REGRESSION" if c.regressed else "ok"
+        return text + f" vs baseline: p50 {c.effect:+.1%}, p={c.p_value:.4f} -> {verdict}"
+
+
+class BenchmarkSuite:
+    """Прогон замеров задержки: прогрев, N измерений, перцентили, сравнение с baseline.
+
+    Результаты копятся по браузерам и пишутся в ``<out_dir>/<browser>.json``
+    (под xdist — ``<browser>.<worker>.json``, которые в конце прогона сливаются
+    в один файл). Baseline — каталог с такими же файлами от эталонного прогона;
+    если для браузера в нём ничего нет, это громко сообщается. Регрессия засчитывается, только если
+    односторонний тест Манна — Уитни значим (``p < alpha``) и медиана выросла
+    не меньше чем на ``min_effect``: шум и статистически незначимые сдвиги
+    не роняют прогон.
+    """
+
+    def __init__(self, out_dir: str | os.PathLike, baseline_dir: str | os.PathLike | None = None,
+                 warmup: int = 3, iterations: int = 20, alpha: float = 0.01, min_effect: float = 0.1):
+        if iterations < 1 or warmup < 0:
+            raise ValueError("Benchmark needs iterations >= 1 and warmup >= 0")
+        self.out_dir = Path(out_dir)
+        self.baseline_dir = Path(baseline_dir) if baseline_dir else None
+        self.warmup = warmup
+        self.iterations = iterations
+        self.alpha = alpha
+        self.min_effect = min_effect
+        self.worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self._results: Dict[str, Dict[str, BenchmarkResult]] = {}
+        self._baselines: Dict[str, Dict[str, dict]] = {}
+        self.log = Logger.get_logger(self.__class__.__name__)
+
+    def run(self, browser: str, name: str, measure: Callable[[], float | None]) -> BenchmarkResult:
+        """Выполнить ``measure`` (возвращает миллисекунды) warmup + iterations раз."""
+        for _ in range(self.warmup):
+            measure()
+        samples: List[float] = []
+        for i in range(self.iterations):
+            value = measure()
+            if value is None:
+                raise RuntimeError(f"Benchmark {name}: iteration {i + 1} returned no measurement")
+            samples.append(float(value))
+
+        baseline = self._baseline(browser).get(name)
+        comparison = self.compare(samples, baseline["samples"]) if baseline else None
+        result = BenchmarkResult(name, browser, summarize(samples), samples, comparison)
+        self._results.setdefault(browser, {})[name] = result
+        self.log.info(result.describe())
+        return result
+
+    def compare(self, current: Sequence[float], baseline: Sequence[float]) -> Comparison:
+        _, p_value = mann_whitney_u(current, baseline)
+        base_p50 = percentile(baseline, 50)
+        effect = percentile(current, 50) / base_p50 - 1 if base_p50 > 0 else 0.0
+        return Comparison(p_value, effect, p_value < self.alpha and effect >= self.min_effect)
+
+    def save(self) -> None:
+        if not self._results:
+            return
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        for browser, results in self._results.items():
+            name = f"{browser}.json" if self.worker == "main" else f"{browser}.{self.worker}.json"
+            data = {
+                "browser": browser,
+                "created": datetime.now(timezone.utc).isoformat(),
+                "warmup": self.warmup,
+                "iterations": self.iterations,
+                "results": {
+                    r.name: {
+                        "stats": r.stats,
+                        "samples": r.samples,
+                        "comparison": r.comparison._asdict() if r.comparison else None,
+                    }
+                    for r in results.values()
+                },
+            }
+            (self.out_dir / name).write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+            self.log.info(f"Benchmark: saved {len(results)} result(s) to {self.out_dir / name}")
+
+    def _baseline(self, browser: str) -> Dict[str, dict]:
+        if browser not in self._baselines:
+            results: Dict[str, dict] = {}
+            if self.baseline_dir:
+                results = load_results(self.baseline_dir, browser)
+                if not results:
+                    # без baseline регрессия не может уронить прогон — об этом надо знать
+                    msg = (f"Benchmark baseline is set but has no results for {browser} in {self.baseline_dir} "
+                           f"(expected {browser}.json or {browser}.<worker>.json); comparisons are skipped")
+                    self.log.error(msg)
+                    warnings.warn(msg)
+            self._baselines[browser] = results
+        return self._baselines[browser]
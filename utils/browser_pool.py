@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import os
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+from utils.logger import Logger
+
+DriverFactory = Callable[[str], WebDriver]
+DriverCloser = Callable[[WebDriver], None]
+
+
+class BrowserPool:
+    """Пул живых браузерных сессий в рамках одного pytest-процесса (xdist-воркера).
+
+    Держит до ``size`` свободных сессий на каждое имя браузера, выдаёт их тестам
+    и сбрасывает состояние между тестами. Сессия, которая упала или не прошла
+    сброс, закрывается и при следующем запросе заменяется новой.
+
+    При ``prewarm > 0`` следующие сессии запускаются в фоновых потоках, пока
+    идёт текущий тест, и тест забирает уже готовый браузер.
+
+    При ``keep_page=True`` сброс не уводит сессию на ``about:blank``: следующий
+    тест на той же странице сбросит её состояние на месте (``BasePage.reset_state``).
+    """
+
+    def __init__(self, factory: DriverFactory, closer: DriverCloser, size: int = 1, prewarm: int = 0,
+                 keep_page: bool = False):
+        self._factory = factory
+        self._closer = closer
+        self.size = max(1, int(size))
+        self.prewarm = max(0, int(prewarm))
+        self.keep_page = keep_page
+        self._idle: Dict[str, List[WebDriver]] = {}
+        self._pending: Dict[str, List[Future]] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.prewarm, thread_name_prefix="prewarm") if self.prewarm else None
+        self.worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.log = Logger.get_logger(self.__class__.__name__)
+
+        self.startup_total = 0.0
+        self.startups = 0
+        self.saved_total = 0.0
+
+    def warm_up(self, browser_names: Iterable[str]) -> None:
+        for name in browser_names:
+            self._top_up(name)
+
+    def acquire(self, browser_name: str) -> WebDriver:
+        while True:
+            with self._lock:
+                idle = self._idle.setdefault(browser_name, [])
+                drv = idle.pop() if idle else None
+                fut = None
+                if drv is None:
+                    pending = self._pending.setdefault(browser_name, [])
+                    fut = pending.pop(0) if pending else None
+
+            if drv is None and fut is not None:
+                drv = self._take_prewarmed(browser_name, fut)
+                if drv is None:
+                    continue
+                self._top_up(browser_name)
+                return drv
+
+            if drv is None:
+                self.log.info(f"[{self.worker}] Pool: starting new {browser_name} session")
+                drv, _ = self._spawn(browser_name)
+                self._top_up(browser_name)
+                return drv
+
+            if self._is_alive(drv):
+                self.log.debug(f"[{self.worker}] Pool: reuse {browser_name} session {drv.session_id}")
+                self._top_up(browser_name)
+                return drv
+            self.log.warning(f"[{self.worker}] Pool: {browser_name} session is dead, replacing")
+            self.discard(drv)
+
+    def release(self, browser_name: str, drv: WebDriver) -> None:
+        if not self._reset(drv):
+            self.log.warning(f"[{self.worker}] Pool: reset failed for {browser_name}, discarding session")
+            self.discard(drv)
+            self._top_up(browser_name)
+            return
+        with self._lock:
+            idle = self._idle.setdefault(browser_name, [])
+            if len(idle) < self.size:
+                idle.append(drv)
+                return
+        self.discard(drv)
+
+    def discard(self, drv: WebDriver) -> None:
+        try:
+            self._closer(drv)
+        except Exception as e:
+            self.log.debug(f"Pool: error while closing session: {e}")
+
+    def close_all(self) -> None:
+        with self._lock:
+            drivers = [d for idle in self._idle.values() for d in idle]
+            futures = [f for pending in self._pending.values() for f in pending]
+            self._idle.clear()
+            self._pending.clear()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+        for fut in futures:
+            try:
+                drivers.append(fut.result()[0])
+            except Exception:
+                pass
+        self.log.info(f"[{self.worker}] Pool: closing {len(drivers)} idle session(s)")
+        for drv in drivers:
+            self.discard(drv)
+        if self.startups:
+            self.log.info(
+                f"[{self.worker}] Pool stats: {self.startups} startup(s), "
+                f"avg {self.startup_total / self.startups:.2f}s, saved by prewarm {self.saved_total:.2f}s"
+            )
+
+    def _spawn(self, browser_name: str) -> Tuple[WebDriver, float]:
+        t0 = time.monotonic()
+        drv = self._factory(browser_name)
+        dt = time.monotonic() - t0
+        with self._lock:
+            self.startup_total += dt
+            self.startups += 1
+        self.log.info(f"[{self.worker}] Pool: {browser_name} started in {dt:.2f}s")
+        return drv, dt
+
+    def _top_up(self, browser_name: str) -> None:
+        if not self._executor:
+            return
+        with self._lock:
+            ready = len(self._idle.get(browser_name, [])) + len(self._pending.get(browser_name, []))
+            missing = self.prewarm - ready
+            for _ in range(missing):
+                self._pending.setdefault(browser_name, []).append(
+                    self._executor.submit(self._spawn, browser_name)
+                )
+        if missing > 0:
+            self.log.debug(f"[{self.worker}] Pool: prewarming {missing} {browser_name} session(s)")
+
+    def _take_prewarmed(self, browser_name: str, fut: Future) -> WebDriver | None:
+        t0 = time.monotonic()
+        try:
+            drv, startup = fut.result()
+        except Exception as e:
+            self.log.warning(f"[{self.worker}] Pool: prewarm of {browser_name} failed: {e}")
+            return None
+        waited = time.monotonic() - t0
+        saved = max(0.0, startup - waited)
+        with self._lock:
+            self.saved_total += saved
+        self.log.info(f"[{self.worker}] Pool: took prewarmed {browser_name} (waited {waited:.2f}s, saved {saved:.2f}s)")
+        return drv
+
+    @staticmethod
+    def _is_alive(drv: WebDriver) -> bool:
+        try:
+            return bool(drv.window_handles)
+        except Exception:
+            return False
+
+    def _reset(self, drv: WebDriver) -> bool:
+        try:
+            self._dismiss_alerts(drv)
+
+            handles = drv.window_handles
+            main = handles[0]
+            for h in handles[1:]:
+                drv.switch_to.window(h)
+                drv.close()
+            drv.switch_to.window(main)
+
+            # storage привязан к origin текущей страницы, поэтому чистим его до ухода на about:blank
+            try:
+                drv.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+            except WebDriverException:
+                pass
+            drv.delete_all_cookies()
+            if not self.keep_page:
+                drv.get("about:blank")
+            return True
+        except Exception as e:
+            self.log.debug(f"Pool: reset error: {e}")
+            return False
+
+    @staticmethod
+    def _dismiss_alerts(drv: WebDriver, limit: int = 5) -> None:
+        for _ in range(limit):
+            try:
+                drv.switch_to.alert.dismiss()
+            except NoAlertPresentException:
+                return
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.logger import Logger
+
+ProfileLauncher = Callable[[str, str], WebDriver]
+
+# Файлы блокировок, которые браузер оставляет в живом профиле — в копию их не переносим
+_LOCK_PATTERNS = ("Singleton*", "lock", ".parentlock", "parent.lock", "*.tmp")
+
+# Firefox: выключаем first-run, телеметрию и автообновления ещё до первого запуска шаблона
+_FIREFOX_USER_JS = """\
+user_pref("browser.shell.checkDefaultBrowser", false);
+user_pref("browser.startup.homepage_override.mstone", "ignore");
+user_pref("browser.aboutwelcome.enabled", false);
+user_pref("startup.homepage_welcome_url", "about:blank");
+user_pref("startup.homepage_welcome_url.additional", "");
+user_pref("datareporting.policy.dataSubmissionEnabled", false);
+user_pref("datareporting.healthreport.uploadEnabled", false);
+user_pref("toolkit.telemetry.enabled", false);
+user_pref("app.update.auto", false);
+user_pref("app.update.enabled", false);
+user_pref("extensions.update.enabled", false);
+"""
+
+
+def default_tmpfs_dir() -> str:
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return str(shm)
+    return tempfile.gettempdir()
+
+
+class ProfileTemplates:
+    """Шаблонные профили браузеров и их быстрые копии в RAM-каталоге.
+
+    Шаблон строится один раз на браузер за прогон: браузер запускается на
+    пустом профиле, проходит first-run и инициализацию, после чего закрывается.
+    Каждая сессия получает копию шаблона, которая удаляется после ``quit()``.
+    Шаблон общий для xdist-воркеров одного прогона (``run_id``): строит его тот
+    воркер, который первым захватил lock-каталог, остальные ждут маркер готовности.
+    """
+
+    def __init__(self, root: str | os.PathLike, run_id: str, launcher: ProfileLauncher,
+                 settle_seconds: float = 3.0, build_timeout: float = 180.0):
+        self.root = self.run_dir(root, run_id)
+        self._launcher = launcher
+        self._settle = settle_seconds
+        self._build_timeout = build_timeout
+        self._templates: Dict[str, Path] = {}
+        self._clones: Dict[str, Path] = {}
+        self._lock = threading.Lock()
+        self.log = Logger.get_logger(self.__class__.__name__)
+
+    def clone(self, browser_name: str) -> str:
+        template = self._template(browser_name)
+        dst = self.root / f"{browser_name}-{uuid.uuid4().hex[:12]}"
+        t0 = time.monotonic()
+        shutil.copytree(template, dst, symlinks=True, ignore=shutil.ignore_patterns(*_LOCK_PATTERNS))
+        self.log.debug(f"Profile clone for {browser_name} in {time.monotonic() - t0:.3f}s: {dst}")
+        return str(dst)
+
+    def register(self, drv: WebDriver, profile_dir: str) -> None:
+        with self._lock:
+            self._clones[drv.session_id] = Path(profile_dir)
+
+    def release(self, drv: WebDriver) -> None:
+        with self._lock:
+            path = self._clones.pop(getattr(drv, "session_id", None) or "", None)
+        if path is not None:
+            shutil.rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def run_dir(root: str | os.PathLike, run_id: str) -> Path:
+        return Path(root) / f"ui-profiles-{run_id}"
+
+    @classmethod
+    def cleanup_run(cls, root: str | os.PathLike, run_id: str) -> None:
+        """Удаляет весь каталог прогона (шаблоны и оставшиеся копии)."""
+        shutil.rmtree(cls.run_dir(root, run_id), ignore_errors=True)
+
+    def _template(self, browser_name: str) -> Path:
+        with self._lock:
+            if browser_name in self._templates:
+                return self._templates[browser_name]
+
+            tpl = self.root / f"{browser_name}-template"
+            ready = self.root / f"{browser_name}-template.ready"
+            lock_dir = self.root / f"{browser_name}-template.lock"
+            self.root.mkdir(parents=True, exist_ok=True)
+
+            try:
+                lock_dir.mkdir()
+                owner = True
+            except FileExistsError:
+                owner = False
+
+            if owner:
+                self._build(browser_name, tpl)
+                ready.touch()
+            else:
+                deadline = time.monotonic() + self._build_timeout
+                while not ready.exists():
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"Profile template for {browser_name} was not built in time")
+                    time.sleep(0.2)
+
+            self._templates[browser_name] = tpl
+            return tpl
+
+    def _build(self, browser_name: str, tpl: Path) -> None:
+        self.log.info(f"Building {browser_name} profile template in {tpl}")
+        t0 = time.monotonic()
+        tpl.mkdir(parents=True, exist_ok=True)
+        if browser_name == "firefox":
+            (tpl / "user.js").write_text(_FIREFOX_USER_JS, encoding="utf-8")
+
+        drv = self._launcher(browser_name, str(tpl))
+        try:
+            drv.get("about:blank")
+            # даём браузеру дописать профиль (first-run, компоненты, кэши)
+            time.sleep(self._settle)
+        finally:
+            try:
+                drv.quit()
+            except Exception:
+                pass
+        self.log.info(f"{browser_name} profile template ready in {time.monotonic() - t0:.2f}s")
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import Any
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+def supports_cdp(driver: WebDriver) -> bool:
+    """True, если у сессии есть канал Chrome DevTools (локальный Chrome или Remote поверх chromedriver)."""
+    if hasattr(driver, "execute_cdp_cmd"):
+        return True
+    commands = getattr(getattr(driver, "command_executor", None), "_commands", {}) or {}
+    return "executeCdpCommand" in commands
+
+
+def cdp(driver: WebDriver, cmd: str, params: dict | None = None) -> Any:
+    """Выполнить CDP-команду и вернуть её результат.
+
+    Работает и для ``webdriver.Chrome``, и для ``webdriver.Remote`` с
+    ``ChromiumRemoteConnection`` (сессии на общем chromedriver-сервисе).
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        return driver.execute_cdp_cmd(cmd, params or {})
+    return driver.execute("executeCdpCommand", {"cmd": cmd, "params": params or {}})["value"]
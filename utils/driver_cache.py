@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from selenium.common.exceptions import NoSuchDriverException
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+
+from utils.logger import Logger
+
+_VERSION_RE = re.compile(r"\d+(?:\.\d+)+")
+
+
+class DriverResolutionCache:
+    """Кэш путей и версий драйверов/браузеров в локальном JSON-файле.
+
+    Первый запуск находит бинари через Selenium Manager (или webdriver-manager,
+    если SM недоступен) и записывает их в файл. Следующие запуски и xdist-воркеры
+    читают файл и не ходят в discovery вообще. Запись считается устаревшей, если
+    файлы пропали или версия установленного браузера не совпадает с записанной.
+    """
+
+    _BROWSER_BINARIES = {
+        "chrome": ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"),
+        "firefox": ("firefox", "firefox-esr"),
+    }
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+        self._resolved: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.log = Logger.get_logger(self.__class__.__name__)
+
+    def resolve(self, browser_name: str, options: ArgOptions) -> str:
+        """Возвращает путь к драйверу и проставляет ``options.binary_location``, если браузер известен."""
+        with self._lock:
+            entry = self._resolved.get(browser_name)
+            if entry is None:
+                entry = self._load_valid_entry(browser_name)
+                if entry is None:
+                    entry = self._discover(browser_name, options)
+                    self._store(browser_name, entry)
+                self._resolved[browser_name] = entry
+
+        if entry.get("browser_path") and not getattr(options, "binary_location", None):
+            options.binary_location = entry["browser_path"]
+        return entry["driver_path"]
+
+    def _load_valid_entry(self, browser_name: str) -> Optional[dict]:
+        entry = self._read().get(browser_name)
+        if not entry:
+            return None
+
+        driver_path = entry.get("driver_path") or ""
+        browser_path = entry.get("browser_path") or ""
+        if not Path(driver_path).is_file() or (browser_path and not Path(browser_path).is_file()):
+            self.log.info(f"Driver cache: {browser_name} entry points to missing files, invalidating")
+            return None
+
+        current = self._version_of(browser_path) if browser_path else ""
+        if current != entry.get("browser_version", ""):
+            self.log.info(
+                f"Driver cache: {browser_name} version changed "
+                f"({entry.get('browser_version')!r} -> {current!r}), invalidating"
+            )
+            return None
+
+        self.log.info(f"Driver cache hit: {browser_name} -> {driver_path}")
+        return entry
+
+    def _discover(self, browser_name: str, options: ArgOptions) -> dict:
+        self.log.info(f"Driver cache miss: resolving {browser_name} driver")
+        try:
+            driver_path = SeleniumManager().driver_location(options)
+        except Exception as e:
+            self.log.warning(f"Selenium Manager failed for {browser_name}: {e}; trying webdriver-manager")
+            driver_path = self._install_with_webdriver_manager(browser_name)
+
+        if not driver_path or not Path(driver_path).is_file():
+            raise NoSuchDriverException(f"Unable to locate or obtain driver for {browser_name}")
+
+        browser_path = getattr(options, "binary_location", None) or self._which_browser(browser_name)
+        entry = {
+            "driver_path": str(driver_path),
+            "driver_version": self._version_of(driver_path),
+            "browser_path": str(browser_path or ""),
+            "browser_version": self._version_of(browser_path) if browser_path else "",
+        }
+
+        drv_major = entry["driver_version"].split(".")[0]
+        br_major = entry["browser_version"].split(".")[0]
+        if browser_name == "chrome" and drv_major and br_major and drv_major != br_major:
+            self.log.warning(f"chromedriver {entry['driver_version']} does not match Chrome {entry['browser_version']}")
+        return entry
+
+    def _store(self, browser_name: str, entry: dict) -> None:
+        data = self._read()
+        data[browser_name] = entry
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self.log.info(f"Driver cache: stored {browser_name} -> {entry['driver_path']}")
+        except OSError as e:
+            self.log.warning(f"Driver cache: cannot write {self.path}: {e}")
+
+    def _read(self) -> dict:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _which_browser(self, browser_name: str) -> Optional[str]:
+        for name in self._BROWSER_BINARIES.get(browser_name, ()):
+            found = shutil.which(name)
+            if found:
+                return found
+        return None
+
+    @staticmethod
+    def _version_of(binary: str) -> str:
+        try:
+            out = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=15).stdout
+        except Exception:
+            return ""
+        m = _VERSION_RE.search(out or "")
+        return m.group(0) if m else ""
+
+    @staticmethod
+    def _install_with_webdriver_manager(browser_name: str) -> str:
+        if browser_name == "chrome":
+            from webdriver_manager.chrome import ChromeDriverManager
+            return ChromeDriverManager().install()
+        if browser_name == "firefox":
+            from webdriver_manager.firefox import GeckoDriverManager
+            return GeckoDriverManager().install()
+        raise ValueError(f"Unsupported browser: {browser_name}")
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, Optional
+
+from selenium import webdriver
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.common.service import Service
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.firefox.remote_connection import FirefoxRemoteConnection
+
+from utils.driver_cache import DriverResolutionCache
+from utils.logger import Logger
+
+
+class DriverServices:
+    """Долгоживущие chromedriver/geckodriver на время pytest-сессии (xdist-воркера).
+
+    Бинарь драйвера ищется и запускается один раз на браузер; тесты открывают
+    и закрывают на нём только WebDriver-сессии. ``driver.quit()`` у таких
+    сессий не останавливает процесс драйвера — это делает ``stop_all()``.
+    """
+
+    _SERVICE_CLASSES = {
+        "chrome": ChromeService,
+        "firefox": FirefoxService,
+    }
+
+    def __init__(self, resolver: DriverResolutionCache | None = None):
+        self._resolver = resolver
+        self._services: Dict[str, Service] = {}
+        self._browser_paths: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+        self.worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.log = Logger.get_logger(self.__class__.__name__)
+
+    def new_session(self, browser_name: str, options: ArgOptions) -> webdriver.Remote:
+        service = self._get_service(browser_name, options)
+        browser_path = self._browser_paths.get(browser_name)
+        if browser_path and not getattr(options, "binary_location", None):
+            options.binary_location = browser_path
+
+        if browser_name == "chrome":
+            executor = ChromiumRemoteConnection(
+                remote_server_addr=service.service_url,
+                vendor_prefix="goog",
+                browser_name="chrome",
+                keep_alive=True,
+                ignore_proxy=options._ignore_local_proxy,
+            )
+        else:
+            executor = FirefoxRemoteConnection(
+                remote_server_addr=service.service_url,
+                keep_alive=True,
+                ignore_proxy=options._ignore_local_proxy,
+            )
+        return webdriver.Remote(command_executor=executor, options=options)
+
+    def stop_all(self) -> None:
+        with self._lock:
+            services = dict(self._services)
+            self._services.clear()
+        for name, service in services.items():
+            self.log.info(f"[{self.worker}] Stopping {name} driver service at {service.service_url}")
+            try:
+                service.stop()
+            except Exception as e:
+                self.log.debug(f"Error while stopping {name} service: {e}")
+
+    def _get_service(self, browser_name: str, options: ArgOptions) -> Service:
+        with self._lock:
+            service = self._services.get(browser_name)
+            if service is not None:
+                try:
+                    service.assert_process_still_running()
+                    return service
+                except Exception:
+                    self.log.warning(f"[{self.worker}] {browser_name} driver service died, restarting")
+                    self._services.pop(browser_name, None)
+
+            if browser_name not in self._SERVICE_CLASSES:
+                raise ValueError(f"Unsupported browser: {browser_name}")
+            service = self._SERVICE_CLASSES[browser_name]()
+            if self._resolver is not None:
+                service.path = self._resolver.resolve(browser_name, options)
+            else:
+                service.path = DriverFinder.get_path(service, options)
+            # Selenium Manager мог найти бинарь браузера — запоминаем для следующих сессий
+            self._browser_paths[browser_name] = getattr(options, "binary_location", None) or None
+            service.start()
+            self.log.info(f"[{self.worker}] Started {browser_name} driver service {service.path} at {service.service_url}")
+            self._services[browser_name] = service
+            return service
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import base64
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from utils.local_server import LocalServer, QuietHandler
+
+# Страницы, которые покрывают page objects; остальное (ассеты) относим к странице по Referer
+PAGES = ("click-events", "popups", "form-fields")
+SHARED = "_shared"
+
+_HOP_BY_HOP = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailers",
+    "transfer-encoding", "upgrade", "content-length", "content-encoding",
+}
+_FORWARD_REQUEST_HEADERS = ("accept", "accept-language", "user-agent", "cookie", "content-type", "origin")
+_TEXT_TYPES = ("text/", "javascript", "json", "xml")
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+def page_key(path: str, referer: str = "") -> str:
+    for candidate in (path, urlsplit(referer).path if referer else ""):
+        first = candidate.strip("/").split("/", 1)[0]
+        if first in PAGES:
+            return first
+    return SHARED
+
+
+class HarServer(LocalServer):
+    """Локальный HTTP-сервер, через который браузер ходит в AUT вместо ``--base-url``.
+
+    ``record``: проксирует каждый запрос на upstream и складывает ответы (статус,
+    заголовки, тело, время) в HAR-архивы по страницам: ``click-events.har``,
+    ``popups.har``, ``form-fields.har`` и ``_shared.har``.
+
+    ``replay``: отдаёт ответы из архивов, не выходя в сеть; с ``replay_timing``
+    выдерживает записанное время ответа.
+
+    В текстовых ответах абсолютные ссылки на upstream переписываются на адрес
+    сервера, чтобы ассеты первой стороны тоже шли через него.
+    """
+
+    def __init__(self, mode: str, har_dir: str | os.PathLike, upstream: str = "", replay_timing: bool = False):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported HAR mode: {mode}")
+        super().__init__(_HarHandler)
+        self.mode = mode
+        self.har_dir = Path(har_dir)
+        self.upstream = upstream.rstrip("/")
+        self.replay_timing = replay_timing
+        self.worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self._entries: Dict[str, List[dict]] = {}
+        self._index: Dict[Tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+        self._opener = urllib.request.build_opener(_NoRedirect)
+        self.misses = 0
+        if mode == "replay":
+            self._load()
+        elif not self.upstream:
+            raise ValueError("HAR record mode needs an upstream base URL")
+
+    # --- record ---
+    def forward(self, method: str, path: str, headers: Dict[str, str], body: bytes | None) -> Tuple[int, str, list, bytes, float]:
+        req_headers = {k: v for k, v in headers.items() if k.lower() in _FORWARD_REQUEST_HEADERS}
+        req_headers["Accept-Encoding"] = "identity"
+        req = urllib.request.Request(self.upstream + path, data=body, headers=req_headers, method=method)
+        t0 = time.monotonic()
+        try:
+            resp = self._opener.open(req, timeout=60)
+        except urllib.error.HTTPError as e:
+            resp = e
+        payload = resp.read()
+        elapsed_ms = (time.monotonic() - t0) * 1000
+        status = resp.status if hasattr(resp, "status") else resp.code
+        reason = getattr(resp, "reason", "") or ""
+        resp_headers = [(k, v) for k, v in resp.headers.items()]
+        return status, reason, resp_headers, payload, elapsed_ms
+
+    def record(self, method: str, path: str, req_headers: Dict[str, str], status: int, reason: str,
+               resp_headers: list, payload: bytes, elapsed_ms: float) -> None:
+        content_type = next((v for k, v in resp_headers if k.lower() == "content-type"), "")
+        entry = {
+            "startedDateTime": datetime.now(timezone.utc).isoformat(),
+            "time": round(elapsed_ms, 1),
+            "request": {
+                "method": method,
+                "url": self.upstream + path,
+                "httpVersion": "HTTP/1.1",
+                "headers": [{"name": k, "value": v} for k, v in req_headers.items()],
+                "queryString": [],
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": -1,
+            },
+            "response": {
+                "status": status,
+                "statusText": reason,
+                "httpVersion": "HTTP/1.1",
+                "headers": [{"name": k, "value": v} for k, v in resp_headers],
+                "cookies": [],
+                "content": {
+                    "size": len(payload),
+                    "mimeType": content_type,
+                    "text": base64.b64encode(payload).decode("ascii"),
+                    "encoding": "base64",
+                },
+                "redirectURL": next((v for k, v in resp_headers if k.lower() == "location"), ""),
+                "headersSize": -1,
+                "bodySize": len(payload),
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": round(elapsed_ms, 1), "receive": 0},
+        }
+        key = page_key(path, req_headers.get("Referer", ""))
+        with self._lock:
+            self._entries.setdefault(key, []).append(entry)
+
+    def save(self) -> None:
+        if self.mode != "record":
+            return
+        self.har_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            entries = dict(self._entries)
+        for key, items in entries.items():
+            name = f"{key}.har" if self.worker == "main" else f"{key}.{self.worker}.har"
+            har = {"log": {"version": "1.2", "creator": {"name": "ui-tests", "version": "1"}, "entries": items}}
+            (self.har_dir / name).write_text(json.dumps(har, ensure_ascii=False, indent=1), encoding="utf-8")
+            self.log.info(f"HAR: saved {len(items)} entr(ies) to {self.har_dir / name}")
+
+    # --- replay ---
+    def _load(self) -> None:
+        files = sorted(self.har_dir.glob("*.har"))
+        if not files:
+            raise FileNotFoundError(f"No HAR archives in {self.har_dir}")
+        for f in files:
+            data = json.loads(f.read_text(encoding="utf-8"))
+            for entry in data.get("log", {}).get("entries", []):
+                url = urlsplit(entry["request"]["url"])
+                path = url.path + (f"?{url.query}" if url.query else "")
+                self._index[(entry["request"]["method"].upper(), path)] = entry
+            if not self.upstream and data.get("log", {}).get("entries"):
+                first = urlsplit(data["log"]["entries"][0]["request"]["url"])
+                self.upstream = f"{first.scheme}://{first.netloc}"
+        self.log.info(f"HAR: loaded {len(self._index)} response(s) from {len(files)} archive(s)")
+
+    def count_miss(self) -> None:
+        # handler'ы работают в потоках ThreadingHTTPServer
+        with self._lock:
+            self.misses += 1
+
+    def lookup(self, method: str, path: str) -> Optional[dict]:
+        entry = self._index.get((method.upper(), path))
+        if entry is None and method.upper() == "HEAD":
+            entry = self._index.get(("GET", path))
+        return entry
+
+    # --- общее ---
+    def rewrite(self, headers: list, payload: bytes) -> Tuple[list, bytes]:
+        out_headers = []
+        content_type = ""
+        for name, value in headers:
+            low = name.lower()
+            if low in _HOP_BY_HOP:
+                continue
+            if low == "content-type":
+                content_type = value.lower()
+            if low == "location":
+                value = self._rewrite_text(value)
+            if low == "strict-transport-security":
+                continue
+            if low == "set-cookie":
+                # cookie upstream-домена браузер не примет для 127.0.0.1
+                value = "; ".join(
+                    part.strip() for part in value.split(";")
+                    if part.strip().split("=", 1)[0].lower() not in ("domain", "secure")
+                )
+            out_headers.append((name, value))
+
+        if any(t in content_type for t in _TEXT_TYPES):
+            charset = "utf-8"
+            if "charset=" in content_type:
+                charset = content_type.split("charset=", 1)[1].split(";")[0].strip() or "utf-8"
+            try:
+                payload = self._rewrite_text(payload.decode(charset)).encode(charset)
+            except (LookupError, UnicodeError):
+                pass
+        return out_headers, payload
+
+    def _rewrite_text(self, text: str) -> str:
+        if not self.upstream:
+            return text
+        up = urlsplit(self.upstream)
+        local = urlsplit(self.base_url)
+        for scheme in ("https", "http"):
+            text = text.replace(f"{scheme}://{up.netloc}", self.base_url)
+            text = text.replace(f"{scheme}:\\/\\/{up.netloc}", self.base_url.replace("/", "\\/"))
+        return text.replace(f"//{up.netloc}", f"//{local.netloc}")
+
+
+class _HarHandler(QuietHandler):
+    def _handle(self) -> None:
+        srv: HarServer = self.server.owner
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+
+        if srv.mode == "record":
+            try:
+                status, reason, headers, payload, elapsed = srv.forward(
+                    self.command, self.path, dict(self.headers.items()), body
+                )
+            except Exception as e:
+                srv.log.warning(f"HAR record: upstream error for {self.path}: {e}")
+                self.send_body(502, [("Content-Type", "text/plain")], str(e).encode("utf-8"))
+                return
+            srv.record(self.command, self.path, dict(self.headers.items()), status, reason, headers, payload, elapsed)
+        else:
+            entry = srv.lookup(self.command, self.path)
+            if entry is None:
+                srv.count_miss()
+                srv.log.debug(f"HAR replay: no entry for {self.command} {self.path}")
+                self.send_body(404, [("Content-Type", "text/plain")], b"not recorded")
+                return
+            resp = entry["response"]
+            status = resp["status"]
+            headers = [(h["name"], h["value"]) for h in resp.get("headers", [])]
+            content = resp.get("content", {})
+            text = content.get("text", "")
+            payload = base64.b64decode(text) if content.get("encoding") == "base64" else text.encode("utf-8")
+            if srv.replay_timing:
+                time.sleep(max(0.0, float(entry.get("time", 0))) / 1000)
+
+        headers, payload = srv.rewrite(headers, payload)
+        self.send_body(status, headers, payload)
+
+    do_GET = _handle
+    do_POST = _handle
+    do_HEAD = _handle
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Type
+
+from utils.logger import Logger
+
+
+class LocalServer:
+    """In-process HTTP-сервер на 127.0.0.1 в фоновом потоке.
+
+    Handler получает ссылку на владельца через ``self.server.owner``.
+    """
+
+    def __init__(self, handler_cls: Type[BaseHTTPRequestHandler], host: str = "127.0.0.1", port: int = 0):
+        self._httpd = ThreadingHTTPServer((host, port), handler_cls)
+        self._httpd.daemon_threads = True
+        self._httpd.owner = self
+        self._thread: threading.Thread | None = None
+        self.log = Logger.get_logger(self.__class__.__name__)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LocalServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name=self.__class__.__name__, daemon=True)
+        self._thread.start()
+        self.log.info(f"{self.__class__.__name__} listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+
+class QuietHandler(BaseHTTPRequestHandler):
+    """Базовый handler: HTTP/1.1 keep-alive и логирование в наш логгер вместо stderr."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        Logger.get_logger(self.__class__.__name__).debug(format % args)
+
+    def send_body(self, status: int, headers: list[tuple[str, str]], body: bytes) -> None:
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+from utils.logger import Logger
+
+Candidate = Tuple[str, str]
+
+
+def candidate_key(locator: Candidate) -> str:
+    return f"{locator[0]}|{locator[1]}"
+
+
+class LocatorMemo:
+    """Память о том, какой из кандидатов-локаторов сработал в прошлый раз.
+
+    Ключ — (страница, логический элемент), значение — ``"by|value"`` последнего
+    сработавшего кандидата. Без ``path`` память живёт в процессе; с ``path``
+    пишется в JSON-файл (атомарно, со слиянием с содержимым на диске), так что
+    следующие прогоны и xdist-воркеры стартуют «тёплыми». Запись, которая
+    больше не совпадает, перезаписывается новым кандидатом или удаляется.
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None):
+        self.path = Path(path) if path else None
+        self._data: Dict[str, Dict[str, str]] | None = None
+        self._lock = threading.Lock()
+        self.log = Logger.get_logger(self.__class__.__name__)
+
+    def order(self, page: str, element: str, candidates: Sequence[Candidate]) -> list:
+        """Кандидаты в порядке проверки: запомненный — первым, остальные как были."""
+        ordered = list(candidates)
+        key = self._get(page, element)
+        for i, loc in enumerate(ordered):
+            if candidate_key(loc) == key:
+                ordered.insert(0, ordered.pop(i))
+                break
+        return ordered
+
+    def remember(self, page: str, element: str, locator: Candidate) -> None:
+        key = candidate_key(locator)
+        if self._get(page, element) == key:
+            return
+        self.log.debug(f"Locator memo: {page}.{element} -> {key}")
+        self._update(page, element, key)
+
+    def forget(self, page: str, element: str) -> None:
+        if self._get(page, element) is not None:
+            self.log.debug(f"Locator memo: {page}.{element} no longer matches, dropped")
+            self._update(page, element, None)
+
+    def _get(self, page: str, element: str) -> Optional[str]:
+        with self._lock:
+            if self._data is None:
+                self._data = self._read()
+            return self._data.get(page, {}).get(element)
+
+    def _update(self, page: str, element: str, key: Optional[str]) -> None:
+        with self._lock:
+            # сливаем с диском: другие воркеры могли дописать свои записи
+            data = self._read() if self.path else (self._data or {})
+            if key is None:
+                data.get(page, {}).pop(element, None)
+            else:
+                data.setdefault(page, {})[element] = key
+            self._data = data
+            if self.path:
+                self._write(data)
+
+    def _read(self) -> Dict[str, Dict[str, str]]:
+        if not self.path:
+            return {}
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, data: dict) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            self.log.warning(f"Locator memo: cannot write {self.path}: {e}")
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import base64
+import fnmatch
+import json
+import re
+from pathlib import Path
+from typing import Iterable, List
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.cdp import cdp, supports_cdp
+from utils.logger import Logger
+
+# Прокси, на котором гарантированно никто не слушает: заблокированный запрос падает сразу
+_DEAD_PROXY = "PROXY 127.0.0.1:9"
+
+
+class NetworkBlocker:
+    """Блокировка сторонних запросов (аналитика, реклама, шрифты) по glob-шаблонам.
+
+    Chrome: ``Network.setBlockedURLs`` через CDP сразу после создания сессии;
+    заблокированные запросы считаются по performance-логу (``Network.loadingFailed``
+    с ``blockedReason``).
+
+    Firefox: в Selenium 4.15 для Python нет BiDi network interception, поэтому
+    шаблоны компилируются в PAC-скрипт, который отправляет совпавшие URL на
+    мёртвый прокси. Для HTTPS ``FindProxyForURL`` получает только схему и хост,
+    поэтому шаблоны с путём (``*/ads/*.js``) там не срабатывают — о них
+    предупреждаем при старте. Подсчёт — по Resource Timing страницы и поэтому
+    приблизительный: видны только запросы, оставившие запись в текущем документе.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = [p.strip() for p in patterns if p and p.strip()]
+        self.log = Logger.get_logger(self.__class__.__name__)
+
+    @classmethod
+    def from_sources(cls, file_path: str | None, ini_lines: Iterable[str] | None) -> "NetworkBlocker":
+        patterns: List[str] = list(ini_lines or [])
+        if file_path:
+            for line in Path(file_path).read_text(encoding="utf-8").splitlines():
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    patterns.append(line)
+        return cls(patterns)
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    # --- до запуска браузера ---
+    def chrome_logging_prefs(self, prefs: dict) -> dict:
+        return {**prefs, "performance": "ALL"}
+
+    def firefox_prefs(self) -> dict:
+        with_path = self.path_patterns()
+        if with_path:
+            self.log.warning(
+                f"Block list: Firefox PAC sees only scheme and host of HTTPS URLs; "
+                f"these patterns match plain HTTP only: {', '.join(with_path)}"
+            )
+        pac = (
+            "function FindProxyForURL(url, host) {\n"
+            f"  var patterns = {json.dumps(self.patterns)};\n"
+            "  for (var i = 0; i < patterns.length; i++) {\n"
+            "    if (shExpMatch(url, patterns[i]) || shExpMatch(host, patterns[i])) {\n"
+            f"      return {json.dumps(_DEAD_PROXY)};\n"
+            "    }\n"
+            "  }\n"
+            "  return 'DIRECT';\n"
+            "}\n"
+        )
+        encoded = base64.b64encode(pac.encode("utf-8")).decode("ascii")
+        return {
+            "network.proxy.type": 2,
+            "network.proxy.autoconfig_url": f"data:application/x-ns-proxy-autoconfig;base64,{encoded}",
+            "network.proxy.failover_direct": False,
+        }
+
+    # --- после создания сессии, до первой навигации ---
+    def apply(self, driver: WebDriver, browser_name: str) -> None:
+        if browser_name != "chrome":
+            return
+        if not supports_cdp(driver):
+            self.log.warning("Block list: session has no CDP channel, URLs are not blocked")
+            return
+        cdp(driver, "Network.enable")
+        cdp(driver, "Network.setBlockedURLs", {"urls": self.patterns})
+        self.log.debug(f"Block list applied to {driver.session_id}: {len(self.patterns)} pattern(s)")
+
+    # --- учёт заблокированных запросов по тесту ---
+    def reset_counter(self, driver: WebDriver, browser_name: str) -> None:
+        if browser_name == "chrome":
+            self._drain_performance_log(driver)
+
+    def blocked_requests(self, driver: WebDriver, browser_name: str) -> List[str]:
+        """Заблокированные URL; в Chrome — точно, в Firefox — по Resource Timing (best-effort)."""
+        if browser_name == "chrome":
+            return self._blocked_from_performance_log(driver)
+        return self._blocked_from_resource_timing(driver)
+
+    def _drain_performance_log(self, driver: WebDriver) -> list:
+        try:
+            return driver.get_log("performance") or []
+        except Exception:
+            return []
+
+    def _blocked_from_performance_log(self, driver: WebDriver) -> List[str]:
+        urls_by_id: dict = {}
+        blocked: List[str] = []
+        for entry in self._drain_performance_log(driver):
+            try:
+                msg = json.loads(entry.get("message", "{}")).get("message", {})
+            except ValueError:
+                continue
+            method = msg.get("method")
+            params = msg.get("params", {})
+            if method == "Network.requestWillBeSent":
+                urls_by_id[params.get("requestId")] = params.get("request", {}).get("url", "")
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked.append(urls_by_id.get(params.get("requestId"), params.get("requestId", "")))
+        return blocked
+
+    def _blocked_from_resource_timing(self, driver: WebDriver) -> List[str]:
+        try:
+            urls = driver.execute_script(
+                "return performance.getEntriesByType('resource').map(e => e.name);"
+            ) or []
+        except Exception:
+            return []
+        return [u for u in urls if self.matches(u)]
+
+    def path_patterns(self) -> List[str]:
+        """Шаблоны, которые ограничивают путь URL (после хоста есть что-то кроме ``*``)."""
+        result = []
+        for p in self.patterns:
+            rest = re.sub(r"^[^/]*://", "", p)
+            if "/" in rest and rest.split("/", 1)[1].strip("*"):
+                result.append(p)
+        return result
+
+    def matches(self, url: str) -> bool:
+        return any(fnmatch.fnmatchcase(url, p) for p in self.patterns)
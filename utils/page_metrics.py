@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import allure
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.cdp import cdp, supports_cdp
+from utils.logger import Logger
+
+# Navigation Timing, paint timing и Resource Timing одним async-скриптом. При eager-загрузке
+# driver.get возвращается до load, поэтому скрипт сначала ждёт readyState === 'complete'
+# и loadEventEnd > 0 (не дольше arguments[0] мс), затем снимает метрики. LCP берётся из
+# буфера PerformanceObserver через takeRecords() — синхронно, без ожидания колбэка.
+# Времена — мс от начала навигации; не наступившие к дедлайну этапы — null.
+_JS_COLLECT = r"""
+    const done = arguments[arguments.length - 1];
+    const loaded = () => {
+        const nav = performance.getEntriesByType('navigation')[0];
+        return document.readyState === 'complete' && (!nav || nav.loadEventEnd > 0);
+    };
+    let finished = false, ticker = null, timer = null;
+    const finish = () => {
+        if (finished) return;
+        finished = true;
+        clearInterval(ticker);
+        clearTimeout(timer);
+        done(collect());
+    };
+    if (loaded()) { finish(); return; }
+    ticker = setInterval(() => { if (loaded()) finish(); }, 50);
+    timer = setTimeout(finish, arguments[0]);
+
+    function collect() {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const at = (v) => (nav && v > 0 ? Math.round(v * 10) / 10 : null);
+    const paints = {};
+    for (const p of performance.getEntriesByType('paint')) paints[p.name] = Math.round(p.startTime * 10) / 10;
+    let lcp = null;
+    if ((PerformanceObserver.supportedEntryTypes || []).includes('largest-contentful-paint')) {
+        const po = new PerformanceObserver(() => {});
+        po.observe({type: 'largest-contentful-paint', buffered: true});
+        const entries = po.takeRecords();
+        po.disconnect();
+        if (entries.length) lcp = Math.round(entries[entries.length - 1].startTime * 10) / 10;
+    }
+    const resources = performance.getEntriesByType('resource');
+    const sum = (key) => resources.reduce((acc, r) => acc + (r[key] || 0), 0);
+    return {
+        ready_state: document.readyState,
+        ttfb: at(nav && nav.responseStart),
+        dns: nav ? Math.round((nav.domainLookupEnd - nav.domainLookupStart) * 10) / 10 : null,
+        connect: nav ? Math.round((nav.connectEnd - nav.connectStart) * 10) / 10 : null,
+        response_end: at(nav && nav.responseEnd),
+        dom_interactive: at(nav && nav.domInteractive),
+        dom_content_loaded: at(nav && nav.domContentLoadedEventEnd),
+        load: at(nav && nav.loadEventEnd),
+        fp: paints['first-paint'] === undefined ? null : paints['first-paint'],
+        fcp: paints['first-contentful-paint'] === undefined ? null : paints['first-contentful-paint'],
+        lcp: lcp,
+        document_transfer_size: nav ? nav.transferSize : null,
+        document_body_size: nav ? nav.decodedBodySize : null,
+        resource_count: resources.length,
+        resource_transfer_size: sum('transferSize'),
+        resource_body_size: sum('decodedBodySize'),
+    };
+    }
+"""
+
+BUDGET_MODES = ("off", "warn", "fail")
+
+
+def page_name(url: str) -> str:
+    """Имя страницы для бюджетов: первый сегмент пути (``click-events``) или ``index``."""
+    first = urlsplit(url).path.strip("/").split("/", 1)[0]
+    return first or "index"
+
+
+def parse_budgets(lines: Iterable[str]) -> Dict[str, Dict[str, float]]:
+    """Разобрать строки ``<page>: metric=limit ...``; ``*`` — бюджет для всех страниц.
+
+    Метрики CDP задаются с префиксом ``cdp.`` (``cdp.JSHeapUsedSize=20000000``).
+    """
+    budgets: Dict[str, Dict[str, float]] = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        page, sep, rest = line.partition(":")
+        if not sep or not page.strip():
+            raise ValueError(f"Malformed page budget (expected '<page>: metric=limit ...'): {line!r}")
+        limits = budgets.setdefault(page.strip(), {})
+        for item in rest.split():
+            name, eq, value = item.partition("=")
+            try:
+                if not eq or not name:
+                    raise ValueError(item)
+                limits[name] = float(value)
+            except ValueError:
+                raise ValueError(f"Malformed page budget item {item!r} in {line!r}") from None
+    return budgets
+
+
+class PageLoadMetrics:
+    """Метрики загрузки страницы после каждого ``BasePage.open``.
+
+    Дожидается события load (не дольше ``timeout``) и собирает Navigation Timing,
+    FP/FCP/LCP, размеры передачи и число ресурсов; в Chrome добавляет
+    ``Performance.getMetrics`` из CDP. Результат прикладывается к Allure и
+    дописывается строкой в JSONL-файл прогона (``path``), затем сверяется с
+    бюджетами страницы: ``warn`` пишет предупреждение, ``fail`` роняет тест.
+    Метрики, которых нет (null), не проверяются — это тоже пишется в лог.
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None,
+                 budgets: Dict[str, Dict[str, float]] | None = None,
+                 budget_mode: str = "warn", run_id: str = ""):
+        if budget_mode not in BUDGET_MODES:
+            raise ValueError(f"Unsupported page budget mode: {budget_mode!r}")
+        self.path = Path(path) if path else None
+        self.budgets = budgets or {}
+        self.budget_mode = budget_mode
+        self.run_id = run_id
+        self._cdp_sessions: set = set()
+        self._lock = threading.Lock()
+        self.log = Logger.get_logger(self.__class__.__name__)
+
+    def after_open(self, driver: WebDriver, url: str, timed_out: bool = False,
+                   timeout: float = 10.0) -> Optional[Dict[str, Any]]:
+        metrics = self.collect(driver, timeout)
+        if metrics is None:
+            return None
+        page = page_name(url)
+        record = {
+            "run_id": self.run_id,
+            "worker": os.getenv("PYTEST_XDIST_WORKER", "main"),
+            "time": datetime.now(timezone.utc).isoformat(),
+            "page": page,
+            "url": url,
+            "browser": str((driver.capabilities or {}).get("browserName", "")).lower(),
+            "timed_out": timed_out,
+            **metrics,
+        }
+        self.log.info(
+            f"Page load {page} (ms): ttfb={record.get('ttfb')} dcl={record.get('dom_content_loaded')} "
+            f"fcp={record.get('fcp')} lcp={record.get('lcp')} resources={record.get('resource_count')}"
+        )
+        self._attach(record)
+        self._append(record)
+        self.check_budgets(page, record)
+        return record
+
+    def collect(self, driver: WebDriver, timeout: float = 10.0) -> Optional[Dict[str, Any]]:
+        try:
+            metrics = driver.execute_async_script(_JS_COLLECT, int(timeout * 1000)) or {}
+        except WebDriverException as e:
+            self.log.warning(f"Page load metrics unavailable: {e.__class__.__name__}")
+            return None
+        metrics["cdp"] = self._cdp_metrics(driver)
+        return metrics
+
+    def check_budgets(self, page: str, record: Dict[str, Any]) -> List[str]:
+        if self.budget_mode == "off":
+            return []
+        limits = {**self.budgets.get("*", {}), **self.budgets.get(page, {})}
+        violations: List[str] = []
+        skipped: List[str] = []
+        for name, limit in limits.items():
+            value = (record.get("cdp") or {}).get(name[4:]) if name.startswith("cdp.") else record.get(name)
+            if not isinstance(value, (int, float)):
+                skipped.append(name)
+            elif value > limit:
+                violations.append(f"{page}: {name}={value:g} exceeds budget {limit:g}")
+        if skipped:
+            self.log.warning(f"Page load budget not checked for {page}, metric(s) unavailable: {', '.join(skipped)}")
+        if not violations:
+            return []
+        text = "\n".join(violations)
+        try:
+            allure.attach(text, "page_budget_violations", allure.attachment_type.TEXT)
+        except Exception:
+            pass
+        if self.budget_mode == "fail":
+            raise AssertionError(f"Page load budget exceeded:\n{text}")
+        for v in violations:
+            self.log.warning(f"Page load budget exceeded: {v}")
+        return violations
+
+    def _cdp_metrics(self, driver: WebDriver) -> Optional[Dict[str, float]]:
+        if "chrome" not in str((driver.capabilities or {}).get("browserName", "")).lower():
+            return None
+        if not supports_cdp(driver):
+            return None
+        try:
+            if driver.session_id not in self._cdp_sessions:
+                cdp(driver, "Performance.enable")
+                self._cdp_sessions.add(driver.session_id)
+            raw = cdp(driver, "Performance.getMetrics") or {}
+        except WebDriverException as e:
+            self.log.debug(f"CDP Performance.getMetrics failed: {e}")
+            return None
+        return {m["name"]: m["value"] for m in raw.get("metrics", [])}
+
+    def _attach(self, record: Dict[str, Any]) -> None:
+        try:
+            allure.attach(json.dumps(record, indent=2, ensure_ascii=False),
+                          f"page_load_{record['page']}", allure.attachment_type.JSON)
+        except Exception:
+            pass
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        if not self.path:
+            return
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        try:
+            with self._lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # одна строка — одна запись в O_APPEND: строки воркеров не перемешиваются
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+        except OSError as e:
+            self.log.warning(f"Page load metrics: cannot write {self.path}: {e}")